@@ -0,0 +1,71 @@
+"""Microbenchmark of Spydr method dispatch, before and after decorating methods per instance.
+
+Before: every attribute access went through `Spydr.__getattribute__`, and DEBUG called `inspect.stack()` per call.
+After: only DEBUG instances have decorated methods, and the caller is checked with `sys._getframe()`.
+
+No browser is needed.  Run from the repository root:
+
+    python -m benchmarks.dispatch
+"""
+import inspect
+import logging
+import timeit
+
+from functools import wraps
+from spydr.utils import LocatorCache
+from spydr.webdriver import Spydr
+
+
+class LegacySpydr(Spydr):
+    """Spydr with the previous `__getattribute__` and `_decorator`."""
+
+    log_level = 50
+
+    def _decorate_methods(self):
+        pass
+
+    def _decorator(self, fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            namespace = inspect.stack()[0].frame.f_back.f_locals
+            if 'self' not in namespace or not isinstance(namespace['self'], self.__class__):
+                p1_args = ', '.join(f'{str(x).strip()}' for x in args)
+                p2_args = ', '.join([f'{k}={str(v).strip()}' for k, v in kwargs.items()])
+                fn_arguments = ", ".join(x for x in [p1_args, p2_args] if x)
+                self.debug(f'{fn.__name__}({fn_arguments})')
+            return fn(*args, **kwargs)
+        return wrapper
+
+    def __getattribute__(self, fn_name):
+        log_level = object.__getattribute__(self, 'log_level')
+        fn_method = object.__getattribute__(self, fn_name)
+        if logging.DEBUG >= log_level and not fn_name.startswith('_') and fn_name not in ['debug', 'info', 't'] and hasattr(fn_method, '__self__'):
+            decorator = object.__getattribute__(self, '_decorator')
+            return decorator(fn_method)
+        return fn_method
+
+
+def spydr(cls, log_level):
+    # Skip __init__, which starts a browser, and set the private fields that methods read
+    instance = cls.__new__(cls)
+    instance._Spydr__metrics = None
+    instance._Spydr__tracer = None
+    instance.locator_cache = LocatorCache()
+    instance.logger = logging.getLogger('spydr.benchmarks')
+    instance.logger.addHandler(logging.NullHandler())
+    instance.logger.propagate = False
+    instance.log_level = log_level
+    return instance
+
+
+def per_call(instance, number):
+    return min(timeit.repeat(lambda: instance.date_sorted([]), number=number, repeat=5)) / number * 1e6
+
+
+if __name__ == '__main__':
+    print(f'{"log_level":<10}{"before (us/call)":>20}{"after (us/call)":>20}')
+
+    for name, log_level, number in (('None', 50, 100000), ('DEBUG', logging.DEBUG, 1000)):
+        before = per_call(spydr(LegacySpydr, log_level), number)
+        after = per_call(spydr(Spydr, log_level), number)
+        print(f'{name:<10}{before:>20.3f}{after:>20.3f}')
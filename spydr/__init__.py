@@ -1,2 +1,8 @@
-from .utils import INI, HOWS, Utils, YML
+from .downloads import DownloadWatcher
+from .metrics import Metrics
+from .screenshots import ScreenshotStore, ScreenshotWriter
+from .tracing import Span, Tracer
+from .utils import INI, HOWS, LocatorCache, Utils, YML
+from .visual import VisualBaselines, VisualDiff
+from .waits import BackoffPoll, FixedPoll, LearnedPoll, PollStrategy, SpydrWait
 from .webdriver import Spydr
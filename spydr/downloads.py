@@ -0,0 +1,290 @@
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import threading
+
+from collections import deque
+from concurrent.futures import Future
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from time import perf_counter
+
+
+PARTIAL_SUFFIXES = ('.crdownload', '.download', '.part', '.partial', '.tmp')
+"""tuple[str]: Suffixes of files still being downloaded (Chrome, Safari, Firefox, and others)"""
+
+
+def completed_files(directory):
+    """Names of completed files in the directory.
+
+    Partially downloaded files (`PARTIAL_SUFFIXES`) are excluded,
+    and so are placeholders of them (like Firefox's empty `file.pdf` next to `file.pdf.part`).
+
+    Args:
+        directory (str): Directory
+
+    Returns:
+        list[str]: Sorted file names
+    """
+    names = {entry.name for entry in os.scandir(directory) if entry.is_file()}
+    return sorted(name for name in names
+                  if not name.lower().endswith(PARTIAL_SUFFIXES)
+                  and not any(f'{name}{suffix}' in names for suffix in PARTIAL_SUFFIXES))
+
+
+class DownloadWatcher:
+    """Watch the directory for completed downloads.
+
+    Files are tracked by inotify on Linux, so a download is completed as soon as it is renamed from its partial name
+    or closed after writing. Elsewhere (or when inotify is unavailable), the directory is polled,
+    and a file is completed when its size and modification time stay the same between two polls.
+
+    Args:
+        directory (str): Directory to watch
+
+    Keyword Arguments:
+        poll (float): Seconds between polls, and between rescans with inotify. Defaults to 0.25.
+        inotify (bool): Use inotify when available. Defaults to True.
+
+    Raises:
+        WebDriverException: Raise an error when `directory` is not a directory
+
+    Examples:
+        | watcher = DownloadWatcher('downloads')
+        | future = watcher.next_download()
+        | s.click('#export')
+        | path = future.result(timeout=30)
+    """
+
+    def __init__(self, directory, poll=0.25, inotify=True):
+        if not os.path.isdir(directory):
+            raise WebDriverException(f'Not a directory: {directory}')
+
+        self.directory = os.path.abspath(directory)
+        self.poll = poll
+        self.__condition = threading.Condition()
+        self.__downloads = []
+        self.__files = completed_files(self.directory)
+        self.__inotify = None
+        self.__stats = {}
+        self.__stop = threading.Event()
+        self.__unclaimed = deque()
+        self.__waiters = deque()
+        self.__writing = set()
+        self.__written = set()
+
+        if inotify and sys.platform.startswith('linux'):
+            try:
+                self.__inotify = _Inotify(self.directory)
+            except OSError:
+                self.__inotify = None
+
+        self.__thread = threading.Thread(target=self._run, name='spydr-download-watcher', daemon=True)
+        self.__thread.start()
+
+    @property
+    def downloads(self):
+        """Absolute paths of files completed since the watcher started, in order of completion.
+
+        Returns:
+            list[str]: Absolute paths
+        """
+        with self.__condition:
+            return list(self.__downloads)
+
+    @property
+    def files(self):
+        """Names of all completed files in the directory, including those before the watcher started.
+
+        Returns:
+            list[str]: File names
+        """
+        with self.__condition:
+            return list(self.__files)
+
+    @property
+    def uses_inotify(self):
+        """Whether the directory is watched by inotify.
+
+        Returns:
+            bool: True if inotify is used. False if polled.
+        """
+        return self.__inotify is not None
+
+    def close(self):
+        """Stop watching. Futures not yet resolved are cancelled."""
+        self.__stop.set()
+
+        if self.__thread is not threading.current_thread():
+            self.__thread.join()
+
+        with self.__condition:
+            while self.__waiters:
+                self.__waiters.popleft().cancel()
+
+        if self.__inotify is not None:
+            self.__inotify.close()
+            self.__inotify = None
+
+    def next_download(self):
+        """Get a future of the next completed download that is not claimed by an earlier call.
+
+        Returns:
+            Future: Future resolved with the absolute path of the completed file
+        """
+        future = Future()
+
+        with self.__condition:
+            if self.__unclaimed:
+                future.set_result(self.__unclaimed.popleft())
+            else:
+                self.__waiters.append(future)
+
+        return future
+
+    def wait_until_number_of_files(self, number, timeout):
+        """Wait until the directory has the given number of completed files.
+
+        Args:
+            number (int): Number of completed files
+            timeout (float): Seconds to wait
+
+        Raises:
+            TimeoutException: Raise an error when the number of files is not matched before timeout
+
+        Returns:
+            bool: True when matched
+        """
+        end_time = perf_counter() + timeout
+
+        with self.__condition:
+            while len(self.__files) != number:
+                remaining = end_time - perf_counter()
+
+                if remaining <= 0 or self.__stop.is_set():
+                    raise TimeoutException(f'Number of files ({len(self.__files)}) not equal to {number}.')
+
+                self.__condition.wait(remaining)
+
+        return True
+
+    def _complete(self, name):
+        path = os.path.join(self.directory, name)
+        self.__downloads.append(path)
+
+        while self.__waiters:
+            future = self.__waiters.popleft()
+            if future.set_running_or_notify_cancel():
+                future.set_result(path)
+                return
+
+        self.__unclaimed.append(path)
+
+    def _run(self):
+        while not self.__stop.is_set():
+            if self.__inotify is not None:
+                for mask, name in self.__inotify.read(self.poll):
+                    if mask & (_Inotify.IN_CREATE | _Inotify.IN_MODIFY):
+                        self.__writing.add(name)
+                        self.__written.discard(name)
+                    elif mask & (_Inotify.IN_CLOSE_WRITE | _Inotify.IN_MOVED_TO):
+                        self.__writing.discard(name)
+                        self.__written.add(name)
+                    elif mask & (_Inotify.IN_DELETE | _Inotify.IN_MOVED_FROM):
+                        self.__writing.discard(name)
+                        self.__written.discard(name)
+            else:
+                self.__stop.wait(self.poll)
+
+            try:
+                self._scan()
+            except OSError:
+                continue
+
+    def _scan(self):
+        names = completed_files(self.directory)
+
+        if self.__inotify is not None:
+            # With inotify, a new file is completed when it is closed after writing or renamed to its final name.
+            names = [name for name in names
+                     if name in self.__files or (name in self.__written and name not in self.__writing)]
+        else:
+            # Without inotify, a file is completed when its size and modification time are settled.
+            stats = {}
+            for name in names:
+                stat = os.stat(os.path.join(self.directory, name))
+                stats[name] = (stat.st_size, stat.st_mtime_ns)
+            names = [name for name in names if name in self.__files or self.__stats.get(name) == stats[name]]
+            self.__stats = stats
+
+        with self.__condition:
+            known = set(self.__files)
+            new_names = [name for name in names if name not in known]
+            self.__files = names
+
+            for name in new_names:
+                self._complete(name)
+
+            self.__condition.notify_all()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __repr__(self):
+        return f'DownloadWatcher({self.directory!r}, inotify={self.uses_inotify})'
+
+
+class _Inotify:
+    # https://man7.org/linux/man-pages/man7/inotify.7.html
+    IN_MODIFY = 0x00000002
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    EVENT = struct.Struct('iIII')
+
+    def __init__(self, directory):
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1 failed')
+
+        mask = self.IN_MODIFY | self.IN_CLOSE_WRITE | self.IN_MOVED_FROM | self.IN_MOVED_TO | self.IN_CREATE | self.IN_DELETE
+
+        if libc.inotify_add_watch(self.fd, os.fsencode(directory), mask) < 0:
+            errno = ctypes.get_errno()
+            os.close(self.fd)
+            raise OSError(errno, f'inotify_add_watch failed: {directory}')
+
+    def close(self):
+        os.close(self.fd)
+
+    def read(self, timeout):
+        events = []
+        readable, _, _ = select.select([self.fd], [], [], timeout)
+
+        if not readable:
+            return events
+
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return events
+
+        offset = 0
+
+        while offset < len(data):
+            _, mask, _, length = self.EVENT.unpack_from(data, offset)
+            offset += self.EVENT.size
+            name = data[offset:offset + length].rstrip(b'\0')
+            offset += length
+            events.append((mask, os.fsdecode(name)))
+
+        return events
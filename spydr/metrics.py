@@ -0,0 +1,242 @@
+import bisect
+import json
+import threading
+
+from selenium.common.exceptions import WebDriverException
+
+from .utils import Utils
+
+
+class Histogram:
+    """Latency histogram of durations in buckets.
+
+    Args:
+        buckets (list[float]): Sorted upper bounds of buckets in seconds
+    """
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.min = None
+        self.max = None
+
+    def observe(self, seconds):
+        """Add the given duration to the histogram.
+
+        Args:
+            seconds (float): Duration in seconds
+        """
+        self.counts[bisect.bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+        self.min = seconds if self.min is None else min(self.min, seconds)
+        self.max = seconds if self.max is None else max(self.max, seconds)
+
+    def percentile(self, percent):
+        """Estimate the percentile by interpolating within its bucket.
+
+        Args:
+            percent (float): Percentile, like 50, 95, or 99
+
+        Returns:
+            float/None: Duration in seconds or None if nothing is observed
+        """
+        if not self.count:
+            return None
+
+        rank = self.count * percent / 100
+        seen = 0
+
+        for index, count in enumerate(self.counts):
+            if count and seen + count >= rank:
+                lower = self.buckets[index - 1] if index > 0 else 0.0
+                upper = self.buckets[index] if index < len(self.buckets) else self.max
+                lower, upper = max(lower, self.min), min(upper, self.max)
+                return lower + (upper - lower) * (rank - seen) / count
+            seen += count
+
+        return self.max
+
+    def to_dict(self):
+        """Histogram as dict.
+
+        Returns:
+            dict: count, sum, min, max, p50, p95, p99 and non-empty buckets ({upper_bound: count})
+        """
+        return {
+            'count': self.count,
+            'sum': self.sum,
+            'min': self.min,
+            'max': self.max,
+            'p50': self.percentile(50),
+            'p95': self.percentile(95),
+            'p99': self.percentile(99),
+            'buckets': {
+                str(self.buckets[index]) if index < len(self.buckets) else '+Inf': count
+                for index, count in enumerate(self.counts) if count
+            }
+        }
+
+
+class Metrics:
+    """Latency histograms of Spydr methods, SpydrElement methods, and WebDriver commands.
+
+    Durations are grouped by `kind` ('spydr', 'element', or 'command') and `name` (method name or WebDriver command).
+
+    Args:
+        file (str): File to save at `Spydr.quit()`. Saved in Prometheus text format when ending with `.prom` or `.txt`,
+            or as JSON otherwise.  Defaults to None.
+
+    Keyword Arguments:
+        buckets (list[float]): Upper bounds of buckets in seconds. Defaults to `Metrics.BUCKETS`.
+
+    Examples:
+        | s = Spydr(metrics='metrics.json')
+        | s.open('https://www.google.com/')
+        | s.metrics.summary()['command']['get']['p95']
+        | s.quit() # Save metrics.json
+    """
+
+    BUCKETS = tuple(round(0.001 * 2 ** (index / 2), 6) for index in range(41))
+    """tuple[float]: Exponential buckets from 1ms to about 17 minutes"""
+
+    def __init__(self, file=None, buckets=None):
+        self.file = file
+        self.buckets = tuple(sorted(buckets)) if buckets else self.BUCKETS
+        self.__histograms = {}
+        self.__lock = threading.Lock()
+
+    def histogram(self, kind, name):
+        """Get the histogram of the given kind and name.
+
+        Args:
+            kind (str): 'spydr', 'element', or 'command'
+            name (str): Method name or WebDriver command
+
+        Returns:
+            Histogram/None: Histogram or None if nothing is observed
+        """
+        return self.__histograms.get((kind, name))
+
+    def observe(self, kind, name, seconds):
+        """Add the given duration to the histogram of the given kind and name.
+
+        Args:
+            kind (str): 'spydr', 'element', or 'command'
+            name (str): Method name or WebDriver command
+            seconds (float): Duration in seconds
+        """
+        with self.__lock:
+            histogram = self.__histograms.get((kind, name))
+
+            if histogram is None:
+                histogram = self.__histograms[(kind, name)] = Histogram(self.buckets)
+
+            histogram.observe(seconds)
+
+    def reset(self):
+        """Remove all histograms."""
+        with self.__lock:
+            self.__histograms.clear()
+
+    def save(self, file=None):
+        """Save metrics in Prometheus text format (`.prom` or `.txt`) or as JSON.
+
+        Keyword Arguments:
+            file (str): File to save. Defaults to `self.file`.
+
+        Raises:
+            WebDriverException: Raise an error when no file is given
+
+        Returns:
+            str: Absolute path of the file
+        """
+        file = file or self.file
+
+        if not file:
+            raise WebDriverException('No file to save metrics.')
+
+        file_ = Utils.to_abspath(file)
+        text = self.to_prometheus() if file_.lower().endswith(('.prom', '.txt')) else self.to_json()
+
+        with open(file_, 'w', encoding='utf-8') as metrics_file:
+            metrics_file.write(text)
+
+        return file_
+
+    def summary(self):
+        """Summary of all histograms.
+
+        Returns:
+            dict: {kind: {name: Histogram.to_dict()}}
+        """
+        summary = {}
+
+        with self.__lock:
+            for (kind, name), histogram in sorted(self.__histograms.items()):
+                summary.setdefault(kind, {})[name] = histogram.to_dict()
+
+        return summary
+
+    def to_json(self, indent=2):
+        """Metrics as JSON.
+
+        Keyword Arguments:
+            indent (int): JSON indentation. Defaults to 2.
+
+        Returns:
+            str: JSON of `summary()`
+        """
+        return json.dumps(self.summary(), indent=indent)
+
+    def to_prometheus(self, prefix='spydr'):
+        """Metrics in Prometheus text format.
+
+        Histograms are exported as `<prefix>_duration_seconds`, and p50/p95/p99 as `<prefix>_duration_quantile_seconds`.
+
+        Keyword Arguments:
+            prefix (str): Metric name prefix. Defaults to 'spydr'.
+
+        Returns:
+            str: Prometheus text format
+        """
+        histogram_name = f'{prefix}_duration_seconds'
+        quantile_name = f'{prefix}_duration_quantile_seconds'
+        histograms = [
+            f'# HELP {histogram_name} Duration of Spydr methods, SpydrElement methods, and WebDriver commands.',
+            f'# TYPE {histogram_name} histogram'
+        ]
+        quantiles = [
+            f'# HELP {quantile_name} Estimated p50, p95, and p99 of {histogram_name}.',
+            f'# TYPE {quantile_name} gauge'
+        ]
+
+        with self.__lock:
+            for (kind, name), histogram in sorted(self.__histograms.items()):
+                labels = f'kind="{self._escape(kind)}",name="{self._escape(name)}"'
+                cumulative = 0
+
+                for index, count in enumerate(histogram.counts):
+                    cumulative += count
+                    le = repr(float(self.buckets[index])) if index < len(self.buckets) else '+Inf'
+                    histograms.append(f'{histogram_name}_bucket{{{labels},le="{le}"}} {cumulative}')
+
+                histograms.append(f'{histogram_name}_sum{{{labels}}} {histogram.sum}')
+                histograms.append(f'{histogram_name}_count{{{labels}}} {histogram.count}')
+
+                for percent in (50, 95, 99):
+                    quantiles.append(
+                        f'{quantile_name}{{{labels},quantile="{percent / 100}"}} {histogram.percentile(percent)}')
+
+        return '\n'.join(histograms + quantiles) + '\n'
+
+    def _escape(self, value):
+        return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+    def __len__(self):
+        return len(self.__histograms)
+
+    def __repr__(self):
+        return self.summary().__str__()
@@ -0,0 +1,414 @@
+import base64
+import hashlib
+import io
+import json
+import math
+import os
+import threading
+
+from concurrent.futures import ThreadPoolExecutor, wait
+from selenium.common.exceptions import WebDriverException
+
+from .utils import Utils
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+
+FORMATS = {
+    'jpeg': '.jpg',
+    'png': '.png',
+    'webp': '.webp'
+}
+"""dict: File suffixes of screenshot formats"""
+
+
+def write_screenshot(screenshot, filename):
+    """Write the screenshot to the file.
+
+    Args:
+        screenshot (str/bytes): Base64 encoded string or binary data of the screenshot
+        filename (str): Absolute path of the file
+
+    Returns:
+        bool: Whether the file is saved
+    """
+    png = base64.b64decode(screenshot.encode('ascii')) if isinstance(screenshot, str) else screenshot
+
+    try:
+        with open(filename, 'wb') as f:
+            f.write(png)
+    except IOError:
+        return False
+
+    return True
+
+
+def crop_screenshots(screenshot, rects, format='png', quality=None):
+    """Crop the rectangles from the screenshot, decoded once, and encode them.
+
+    Requires Pillow.
+
+    Args:
+        screenshot (str/bytes): Base64 encoded string or binary data of the screenshot
+        rects (list[tuple]): (x, y, width, height) in image pixels, rounded outwards and clipped to the image
+
+    Keyword Arguments:
+        format (str): 'png', 'jpeg', or 'webp'. Defaults to 'png'.
+        quality (int): Compression quality from 0 to 100 ('jpeg' and 'webp'). Defaults to None.
+
+    Raises:
+        WebDriverException: Raise an error when Pillow is not installed
+
+    Returns:
+        list[bytes]: Binary data of the cropped images (None if the rectangle is outside the screenshot)
+    """
+    if Image is None:
+        raise WebDriverException('Pillow is required to crop screenshots: pip install spydr[images]')
+
+    png = base64.b64decode(screenshot.encode('ascii')) if isinstance(screenshot, str) else screenshot
+    options = {} if quality is None else {'quality': quality}
+    images = []
+
+    with Image.open(io.BytesIO(png)) as image:
+        if format == 'jpeg':
+            image = image.convert('RGB')
+
+        for x, y, width, height in rects:
+            left, top = max(math.floor(x), 0), max(math.floor(y), 0)
+            right, bottom = min(math.ceil(x + width), image.width), min(math.ceil(y + height), image.height)
+
+            if right <= left or bottom <= top:
+                images.append(None)
+                continue
+
+            data = io.BytesIO()
+            image.crop((left, top, right, bottom)).save(data, format=format.upper(), **options)
+            images.append(data.getvalue())
+
+    return images
+
+
+def difference_hash(image, size=16):
+    """Perceptual difference hash (dHash) of the image, which changes little when the image changes little.
+
+    Each bit tells whether a pixel is brighter than its right neighbour in the image resized to (size + 1, size).
+
+    Args:
+        image (PIL.Image.Image): Image
+
+    Keyword Arguments:
+        size (int): Number of rows and columns of compared pixels. Defaults to 16 (256-bit hash).
+
+    Returns:
+        int: Hash of `size * size` bits
+    """
+    pixels = list(image.convert('L').resize((size + 1, size), Image.BILINEAR).getdata())
+    bits = 0
+
+    for row in range(size):
+        for column in range(size):
+            bits = (bits << 1) | (pixels[row * (size + 1) + column] > pixels[row * (size + 1) + column + 1])
+
+    return bits
+
+
+class ScreenshotStore:
+    """Content-addressed store of screenshots, which stores each unique screenshot once.
+
+    Screenshots are saved as `objects/<hash[:2]>/<hash><suffix>` by the SHA-256 of their content,
+    and `manifest.jsonl` in the root maps names (like 'login/step1.png') to the hashes.
+    The manifest is appended on each `add()`, and loaded when the store is opened again.
+
+    With `perceptual` (requires Pillow), a screenshot of the same dimensions within `threshold` bits of
+    the 256-bit difference hash of a stored screenshot is collapsed into the stored one,
+    so near-duplicates (like a blinking cursor) are stored once, too.
+
+    Args:
+        root (str): Root directory of the store
+
+    Keyword Arguments:
+        perceptual (bool): Collapse near-duplicates by perceptual hash. Defaults to False.
+        threshold (int): Maximum differing bits (of 256) of near-duplicates. Defaults to 4.
+
+    Raises:
+        WebDriverException: Raise an error when `perceptual` is set without Pillow
+
+    Examples:
+        | store = ScreenshotStore('screens')
+        | store.add(driver.get_screenshot_as_png(), 'login/step1.png')
+        | store.path('login/step1.png')
+        | s = Spydr(screenshot_store=True) # Store screenshots of `save_screenshot()` under screen_root
+    """
+
+    MANIFEST = 'manifest.jsonl'
+    """str: File name of the manifest"""
+
+    HASH_SIZE = 16
+    """int: Size of difference hashes (256 bits)"""
+
+    def __init__(self, root, perceptual=False, threshold=4):
+        if perceptual and Image is None:
+            raise WebDriverException('Pillow is required for perceptual hashes: pip install spydr[images]')
+
+        self.root = Utils.to_abspath(root, isdir=True)
+        self.perceptual = perceptual
+        self.threshold = threshold
+        self.__bands = [{} for _ in range(threshold + 1)]
+        self.__lock = threading.Lock()
+        self.__objects = {}
+        self.__screenshots = {}
+        self._load()
+        self.__manifest = open(os.path.join(self.root, self.MANIFEST), 'a', encoding='utf-8')
+
+    @property
+    def closed(self):
+        """Whether the manifest is closed.
+
+        Returns:
+            bool: True if closed
+        """
+        return self.__manifest.closed
+
+    @property
+    def manifest(self):
+        """Hashes of stored screenshots by name.
+
+        Returns:
+            dict: {name: hash}
+        """
+        with self.__lock:
+            return dict(self.__screenshots)
+
+    def add(self, screenshot, name):
+        """Add the screenshot by name.  The content is only written when no identical (or similar) screenshot is stored.
+
+        Args:
+            screenshot (str/bytes): Base64 encoded string or binary data of the screenshot
+            name (str): Name of the screenshot, like 'login/step1.png'. Its suffix is the suffix of the stored file.
+
+        Returns:
+            str: Absolute path of the stored file
+        """
+        png = base64.b64decode(screenshot.encode('ascii')) if isinstance(screenshot, str) else screenshot
+        name = self._to_name(name)
+        digest = hashlib.sha256(png).hexdigest()
+        dhash = None
+
+        with self.__lock:
+            known = digest in self.__objects
+
+        if not known and self.perceptual:
+            with Image.open(io.BytesIO(png)) as image:
+                dhash = (image.size, difference_hash(image, self.HASH_SIZE))
+
+        with self.__lock:
+            if digest not in self.__objects:
+                similar = self._similar(dhash) if dhash is not None else None
+
+                if similar is not None:
+                    digest = similar
+                else:
+                    file = f'objects/{digest[:2]}/{digest}{os.path.splitext(name)[1]}'
+                    path = os.path.join(self.root, *file.split('/'))
+                    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+                    with open(path, 'wb') as f:
+                        f.write(png)
+
+                    self._index(digest, file, dhash)
+                    self._append({'hash': digest, 'file': file} if dhash is None else
+                                 {'hash': digest, 'file': file, 'size': dhash[0], 'dhash': f'{dhash[1]:x}'})
+
+            self.__screenshots[name] = digest
+            self._append({'name': name, 'hash': digest})
+            return os.path.join(self.root, *self.__objects[digest].split('/'))
+
+    def close(self):
+        """Close the manifest."""
+        with self.__lock:
+            self.__manifest.close()
+
+    def path(self, name):
+        """Get the stored file of the screenshot.
+
+        Args:
+            name (str): Name of the screenshot
+
+        Returns:
+            str/None: Absolute path of the stored file, or None if not stored
+        """
+        with self.__lock:
+            digest = self.__screenshots.get(self._to_name(name))
+            return None if digest is None else os.path.join(self.root, *self.__objects[digest].split('/'))
+
+    def _append(self, entry):
+        if not self.__manifest.closed:
+            self.__manifest.write(f'{json.dumps(entry)}\n')
+            self.__manifest.flush()
+
+    def _bands(self, dhash):
+        # By the pigeonhole principle, hashes within `threshold` bits share at least one of `threshold + 1` bands.
+        (width, height), bits = dhash
+        size = self.HASH_SIZE ** 2 // len(self.__bands) or 1
+        return [(index, (width, height, (bits >> (index * size)) & ((1 << size) - 1)))
+                for index in range(len(self.__bands))]
+
+    def _index(self, digest, file, dhash):
+        self.__objects[digest] = file
+
+        if dhash is not None:
+            for index, band in self._bands(dhash):
+                self.__bands[index].setdefault(band, []).append((dhash[1], digest))
+
+    def _load(self):
+        manifest = os.path.join(self.root, self.MANIFEST)
+
+        if not os.path.isfile(manifest):
+            return
+
+        with open(manifest, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+
+                if 'file' in entry:
+                    dhash = (tuple(entry['size']), int(entry['dhash'], 16)) if entry.get('dhash') else None
+                    self._index(entry['hash'], entry['file'], dhash)
+                elif entry.get('hash') in self.__objects:
+                    self.__screenshots[entry['name']] = entry['hash']
+
+    def _similar(self, dhash):
+        for index, band in self._bands(dhash):
+            for other, digest in self.__bands[index].get(band, ()):
+                if bin(dhash[1] ^ other).count('1') <= self.threshold:
+                    return digest
+
+        return None
+
+    def _to_name(self, name):
+        name = os.fspath(name)
+
+        if os.path.isabs(name):
+            name = os.path.relpath(name, self.root)
+
+        return name.replace(os.sep, '/')
+
+    def __contains__(self, name):
+        with self.__lock:
+            return self._to_name(name) in self.__screenshots
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        with self.__lock:
+            return len(self.__screenshots)
+
+    def __repr__(self):
+        return f'ScreenshotStore({self.root!r}, perceptual={self.perceptual}, threshold={self.threshold})'
+
+
+class ScreenshotWriter:
+    """Decode and write screenshots on background threads.
+
+    Submitting blocks when `max_pending` screenshots are waiting to be written,
+    so a slow disk cannot hold an unbounded number of screenshots in memory.
+
+    Keyword Arguments:
+        max_workers (int): Number of writer threads. Defaults to 2.
+        max_pending (int): Maximum number of screenshots waiting to be written. Defaults to 16.
+
+    Examples:
+        | writer = ScreenshotWriter()
+        | future = writer.submit(driver.get_screenshot_as_base64(), '/tmp/home.png')
+        | writer.flush()
+    """
+
+    def __init__(self, max_workers=2, max_pending=16):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.__executor = ThreadPoolExecutor(max_workers, thread_name_prefix='spydr-screenshot')
+        self.__futures = set()
+        self.__lock = threading.Lock()
+        self.__slots = threading.BoundedSemaphore(max_pending)
+
+    @property
+    def pending(self):
+        """Number of screenshots not written yet.
+
+        Returns:
+            int: Number of screenshots
+        """
+        with self.__lock:
+            return len(self.__futures)
+
+    def close(self):
+        """Write all pending screenshots and stop the writer threads."""
+        self.flush()
+        self.__executor.shutdown(wait=True)
+
+    def flush(self, timeout=None):
+        """Wait until all pending screenshots are written.
+
+        Keyword Arguments:
+            timeout (float): Seconds to wait. Defaults to None (no limit).
+
+        Returns:
+            bool: Whether all pending screenshots are written
+        """
+        with self.__lock:
+            futures = list(self.__futures)
+
+        _, not_done = wait(futures, timeout=timeout)
+        return not not_done
+
+    def submit(self, screenshot, filename, write=write_screenshot):
+        """Write the screenshot to the file in the background.
+
+        Args:
+            screenshot (str/bytes): Base64 encoded string or binary data of the screenshot
+            filename (str): Absolute path of the file, or any target that `write` takes
+
+        Keyword Arguments:
+            write (callable): Function to write `(screenshot, filename)` and return whether the file is saved.
+                Defaults to `write_screenshot`.
+
+        Returns:
+            Future: Future resolved with the return of `write`
+        """
+        self.__slots.acquire()
+
+        try:
+            future = self.__executor.submit(write, screenshot, filename)
+        except BaseException:
+            self.__slots.release()
+            raise
+
+        with self.__lock:
+            self.__futures.add(future)
+
+        future.add_done_callback(self._done)
+        return future
+
+    def _done(self, future):
+        with self.__lock:
+            self.__futures.discard(future)
+
+        self.__slots.release()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __repr__(self):
+        return f'ScreenshotWriter(max_workers={self.max_workers}, max_pending={self.max_pending}, pending={self.pending})'
@@ -0,0 +1,364 @@
+import itertools
+import json
+import os
+import random
+import threading
+import time
+
+from functools import wraps
+from time import perf_counter
+from selenium.common.exceptions import WebDriverException
+
+from .utils import Utils
+
+
+class Span:
+    """A traced invocation.
+
+    Args:
+        name (str): Span name, like method name or WebDriver command
+        kind (str): 'spydr', 'element', 'wait', 'poll', or 'command'
+        args (dict): Span arguments
+        parent (Span): Parent span. Defaults to None.
+    """
+
+    def __init__(self, name, kind, args, parent=None):
+        self.name = name
+        self.kind = kind
+        self.args = args
+        self.parent = parent
+        self.id = None
+        self.attempts = 0
+        self.outcome = 'ok'
+        self.start = None
+        self.duration = None
+
+
+class Tracer:
+    """Trace nested spans of Spydr methods, SpydrElement methods, waits, polls, and WebDriver commands.
+
+    Spans are written as they finish, so the file stays readable if the run is interrupted.
+
+    Args:
+        file (str): File to write spans to.
+
+    Keyword Arguments:
+        sample_rate (float): Fraction of top-level calls (0.0 to 1.0) to trace with all their nested spans. Defaults to 1.0.
+        format (str): 'chrome' (Chrome Trace Event JSON, for chrome://tracing or Perfetto) or 'jsonl' (one span per line).
+            Defaults to 'jsonl' when `file` ends with `.jsonl`, or 'chrome' otherwise.
+        max_arg_length (int): Maximum length of each formatted argument. Defaults to 200.
+
+    Raises:
+        WebDriverException: Raise an error when format or sample_rate is invalid
+
+    Examples:
+        | s = Spydr(tracer='trace.json')
+        | s = Spydr(tracer=Tracer('trace.jsonl', sample_rate=0.1))
+    """
+
+    FORMATS = ('chrome', 'jsonl')
+    """tuple[str]: Supported formats"""
+
+    REDACTED = ('actions', 'clear_and_send_keys', 'send_keys', 'sendKeysToActiveElement', 'sendKeysToElement')
+    """tuple[str]: Names of spans (methods and WebDriver commands) whose typed keys are redacted as '***'"""
+
+    def __init__(self, file, sample_rate=1.0, format=None, max_arg_length=200):
+        if format is None:
+            format = 'jsonl' if str(file).lower().endswith('.jsonl') else 'chrome'
+
+        if format not in self.FORMATS:
+            raise WebDriverException(f'Format must be one of {self.FORMATS}: {format}')
+
+        if not 0 <= sample_rate <= 1:
+            raise WebDriverException(f'sample_rate must be between 0 and 1: {sample_rate}')
+
+        self.file = Utils.to_abspath(file)
+        self.format = format
+        self.sample_rate = sample_rate
+        self.max_arg_length = max_arg_length
+        self.pid = os.getpid()
+        self.__closing = False
+        self.__epoch = time.time() - perf_counter()
+        self.__ids = itertools.count(1)
+        self.__local = threading.local()
+        self.__lock = threading.Lock()
+        # Private, so sampling does not consume the shared random numbers, like of a seeded `random.seed()`.
+        self.__random = random.Random()
+        self.__stream = open(self.file, 'w', encoding='utf-8')
+        self.__written = 0
+
+        if self.format == 'chrome':
+            # The closing bracket is optional in Chrome Trace Event JSON Array Format
+            self.__stream.write('[\n')
+
+    @property
+    def closed(self):
+        """Whether the trace file is closed.
+
+        Returns:
+            bool: True if closed
+        """
+        return self.__stream.closed
+
+    def close(self):
+        """Finish and close the trace file.
+
+        Called within a span, like in traced `Spydr.quit()`, the file is closed after the top-level span of the thread,
+        so the span is still written.
+        """
+        if self._stack():
+            self.__closing = True
+            return
+
+        with self.__lock:
+            if self.__stream.closed:
+                return
+
+            if self.format == 'chrome':
+                self.__stream.write('\n]\n')
+
+            self.__stream.close()
+
+    def current_span(self):
+        """Get the innermost span of the current thread.
+
+        Returns:
+            Span/None: Current span or None if not traced
+        """
+        stack = self._stack()
+        return stack[-1] if stack else None
+
+    def format_args(self, args, kwargs, name=None, kind=None):
+        """Format arguments as span arguments, truncated to `max_arg_length`.
+
+        Keys typed by `REDACTED` spans are replaced by '***': all positional arguments
+        (but the locator of Spydr methods), and the 'text', 'value', and 'actions' of WebDriver commands.
+
+        Args:
+            args (tuple): Positional arguments
+            kwargs (dict): Keyword arguments
+
+        Keyword Arguments:
+            name (str): Span name. Defaults to None.
+            kind (str): 'spydr', 'element', 'wait', 'poll', or 'command'. Defaults to None.
+
+        Returns:
+            dict: {'0': arg, ..., keyword: kwarg}
+        """
+        redacted = name in self.REDACTED
+        formatted = {}
+
+        for index, value in enumerate(args):
+            secret = redacted and not (kind == 'spydr' and index == 0)
+            formatted[str(index)] = '***' if secret else self._truncate(value)
+
+        for key, value in kwargs.items():
+            secret = redacted and key in ('actions', 'text', 'value')
+            formatted[key] = '***' if secret else self._truncate(value)
+
+        return formatted
+
+    def span(self, name, kind, args=None):
+        """Context manager to trace a span, nested in the current span of the thread.
+
+        Args:
+            name (str): Span name
+            kind (str): 'spydr', 'element', 'wait', 'poll', or 'command'
+
+        Keyword Arguments:
+            args (dict/callable): Span arguments, or a callable returning them only when the span is sampled.
+                Defaults to None.
+
+        Returns:
+            _SpanContext: Context manager that yields Span or None when not sampled
+
+        Examples:
+            | with tracer.span('login', 'test', {'user': 'admin'}):
+            |     s.click('#login')
+        """
+        return _SpanContext(self, name, kind, args)
+
+    def trace(self, kind, fn, name=None):
+        """Wrap the callable to trace each call as a span.
+
+        Args:
+            kind (str): 'spydr', 'element', 'wait', 'poll', or 'command'
+            fn (callable): Callable to trace
+
+        Keyword Arguments:
+            name (str): Span name. Defaults to `fn.__name__`.
+
+        Returns:
+            callable: Traced callable
+        """
+        name = name or fn.__name__
+
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            with _SpanContext(self, name, kind, lambda: self.format_args(args, kwargs, name, kind)):
+                return fn(*args, **kwargs)
+        return wrapper
+
+    def trace_wait(self, wait):
+        """Subclass the WebDriverWait class to trace `until()` and `until_not()` with a span for each poll.
+
+        Args:
+            wait (type): WebDriverWait or its subclass
+
+        Returns:
+            type: Traced subclass of `wait`
+        """
+        tracer = self
+
+        class TracedWait(wait):
+            def until(self, method, message=''):
+                with tracer.span('until', 'wait', {'timeout': self._timeout}) as span:
+                    return super().until(tracer._poll(method, span), message)
+
+            def until_not(self, method, message=''):
+                with tracer.span('until_not', 'wait', {'timeout': self._timeout}) as span:
+                    return super().until_not(tracer._poll(method, span), message)
+
+        TracedWait.__name__ = TracedWait.__qualname__ = f'Traced{wait.__name__}'
+        return TracedWait
+
+    def _close_if_closing(self):
+        if self.__closing:
+            self.close()
+
+    def _next_id(self):
+        return next(self.__ids)
+
+    def _poll(self, method, wait_span):
+        name = getattr(method, '__qualname__', None) or getattr(method, '__name__', 'poll')
+
+        @wraps(method)
+        def poll(driver):
+            args = None
+
+            if wait_span is not None:
+                wait_span.attempts += 1
+                args = {'attempt': wait_span.attempts}
+
+            with _SpanContext(self, name, 'poll', args):
+                return method(driver)
+        return poll
+
+    def _sample(self):
+        return self.sample_rate >= 1 or self.__random.random() < self.sample_rate
+
+    def _stack(self):
+        stack = getattr(self.__local, 'stack', None)
+
+        if stack is None:
+            stack = self.__local.stack = []
+
+        return stack
+
+    def _truncate(self, value):
+        text = str(value).strip()
+        return text if len(text) <= self.max_arg_length else f'{text[:self.max_arg_length]}...'
+
+    def _write(self, span):
+        if span.kind == 'wait':
+            span.args['attempts'] = span.attempts
+
+        if self.format == 'chrome':
+            event = {
+                'name': span.name,
+                'cat': span.kind,
+                'ph': 'X',
+                'ts': round(span.start * 1e6, 3),
+                'dur': round(span.duration * 1e6, 3),
+                'pid': self.pid,
+                'tid': threading.get_ident(),
+                'args': dict(span.args, outcome=span.outcome)
+            }
+        else:
+            event = {
+                'id': span.id,
+                'parent': span.parent.id if span.parent else None,
+                'name': span.name,
+                'kind': span.kind,
+                'start': self.__epoch + span.start,
+                'duration': span.duration,
+                'thread': threading.get_ident(),
+                'args': span.args,
+                'outcome': span.outcome
+            }
+
+        line = json.dumps(event, default=str)
+
+        with self.__lock:
+            if self.__stream.closed:
+                return
+
+            if self.format == 'chrome' and self.__written:
+                self.__stream.write(',\n')
+
+            self.__stream.write(line if self.format == 'chrome' else f'{line}\n')
+            self.__written += 1
+
+            if span.parent is None:
+                self.__stream.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __repr__(self):
+        return f'Tracer(file={self.file!r}, sample_rate={self.sample_rate}, format={self.format!r})'
+
+
+class _SpanContext:
+    # Sampling is decided once per top-level span, and nested spans follow the decision.
+    _NOT_SAMPLED = None
+
+    def __init__(self, tracer, name, kind, args):
+        self.tracer = tracer
+        self.name = name
+        self.kind = kind
+        self.args = args
+        self.span = None
+        self.stack = None
+
+    def __enter__(self):
+        self.stack = self.tracer._stack()
+
+        if self.stack:
+            parent = self.stack[-1]
+            sampled = parent is not self._NOT_SAMPLED
+        else:
+            parent = None
+            sampled = self.tracer._sample()
+
+        if not sampled or self.tracer.closed:
+            self.stack.append(self._NOT_SAMPLED)
+            return None
+
+        # Arguments are only formatted for sampled spans.
+        args = self.args() if callable(self.args) else self.args
+        self.span = Span(self.name, self.kind, dict(args or {}), parent)
+        self.span.id = self.tracer._next_id()
+        self.stack.append(self.span)
+        self.span.start = perf_counter()
+        return self.span
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stack.pop()
+
+        if self.span is not None:
+            self.span.duration = perf_counter() - self.span.start
+
+            if exc_type is not None:
+                self.span.outcome = exc_type.__name__
+                self.span.args['error'] = self.tracer._truncate(exc_value)
+
+            self.tracer._write(self.span)
+
+        if not self.stack:
+            self.tracer._close_if_closing()
+
+        return False
@@ -7,6 +7,7 @@ import re
 import shutil
 import yaml
 
+from collections import OrderedDict
 from datetime import datetime
 from functools import reduce
 from selenium.common.exceptions import WebDriverException
@@ -26,6 +27,10 @@ HOWS = {
 }
 """Set of HOW strategies to identify elements."""
 
+_EQ_PATTERN = re.compile(r'(.*):eq\((-?\d+)\)')
+_LAST_PATTERN = re.compile(r'(.*):last$')
+_LOCATOR_PATTERN = re.compile(r'^([A-Za-z_]+)=(.+)')
+
 
 class INI:
     """Access INI `key=value` using JSON serialization.
@@ -115,6 +120,80 @@ class INI:
         return str(section) if section else self.default_section
 
 
+class LocatorCache:
+    """Bounded LRU cache of parsed locators.
+
+    Args:
+        maxsize (int): Maximum number of parsed locators to keep. Defaults to 1024.
+            When set to 0, parsed locators are not cached.
+
+    Examples:
+        | cache = LocatorCache(maxsize=256)
+        | cache.get('css=.tab:eq(2)', parse)
+        | cache.info() # {'hits': 0, 'misses': 1, 'maxsize': 256, 'size': 1}
+    """
+
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize if isinstance(maxsize, int) and maxsize > 0 else 0
+        self.hits = 0
+        self.misses = 0
+        self.__cache = OrderedDict()
+
+    def clear(self):
+        """Remove all parsed locators.  `hits` and `misses` are kept."""
+        self.__cache.clear()
+
+    def get(self, locator, parse):
+        """Get the parsed locator from cache, or parse it with `parse` and cache the result.
+
+        Args:
+            locator (str): Locator
+            parse (callable): Function to parse the locator when not cached
+
+        Returns:
+            Parsed locator returned by `parse`
+        """
+        try:
+            parsed = self.__cache[locator]
+        except KeyError:
+            self.misses += 1
+            parsed = parse(locator)
+
+            if self.maxsize:
+                self.__cache[locator] = parsed
+                if len(self.__cache) > self.maxsize:
+                    self.__cache.popitem(last=False)
+
+            return parsed
+
+        self.hits += 1
+        self.__cache.move_to_end(locator)
+        return parsed
+
+    def info(self):
+        """Cache statistics.
+
+        Returns:
+            dict: {'hits': int, 'misses': int, 'maxsize': int, 'size': int}
+        """
+        return {'hits': self.hits, 'misses': self.misses, 'maxsize': self.maxsize, 'size': len(self)}
+
+    def reset(self):
+        """Remove all parsed locators and reset `hits` and `misses`."""
+        self.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __contains__(self, locator):
+        return locator in self.__cache
+
+    def __len__(self):
+        return len(self.__cache)
+
+    def __repr__(self):
+        return self.info().__str__()
+
+
 class Utils:
     """Utilities for Spydr WebDriver
 
@@ -217,6 +296,36 @@ class Utils:
         string_2_set = set(re.split(sep, string_2))
         return string_1_set == string_2_set
 
+    @staticmethod
+    def parse_eq(what):
+        """Parse CSS selector with `:eq()` or `:last` pseudo selector.
+        Negative index counts from the last element, and `:last` is equivalent to `:eq(-1)`.
+
+        Args:
+            what (str): CSS selector
+
+        Returns:
+            (str, int)/None: (CSS selector without the pseudo selector, index) or None if not used
+
+        Examples:
+            | parse_eq('.tab:eq(2)') => ('.tab', 2)
+            | parse_eq('.tab:eq(-2)') => ('.tab', -2)
+            | parse_eq('.tab:last') => ('.tab', -1)
+            | parse_eq('.tab') => None
+        """
+        matched = _EQ_PATTERN.search(what)
+
+        if matched:
+            selector, index = matched.group(1, 2)
+            return selector, int(index)
+
+        matched = _LAST_PATTERN.search(what)
+
+        if matched:
+            return matched.group(1), -1
+
+        return None
+
     @staticmethod
     def parse_locator(locator):
         """Parse locator with supported `how=what` strategies
@@ -231,7 +340,7 @@ class Utils:
             (str, str): (how, what) strategy
         """
         how = what = None
-        matched = re.search('^([A-Za-z_]+)=(.+)', locator)
+        matched = _LOCATOR_PATTERN.search(locator)
 
         if matched is None:
             what = locator
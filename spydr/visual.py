@@ -0,0 +1,265 @@
+import io
+import math
+import os
+
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from selenium.common.exceptions import WebDriverException
+
+from .utils import Utils
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+
+def to_array(screenshot):
+    """Decode the screenshot into an RGB array.
+
+    Requires NumPy and Pillow.
+
+    Args:
+        screenshot (bytes/str/numpy.ndarray): Binary data of the image, image file, or array
+
+    Raises:
+        WebDriverException: Raise an error when NumPy or Pillow is not installed
+
+    Returns:
+        numpy.ndarray: Array of shape (height, width, 3) and dtype uint8
+    """
+    _require()
+
+    if isinstance(screenshot, np.ndarray):
+        return screenshot
+
+    with Image.open(io.BytesIO(screenshot) if isinstance(screenshot, bytes) else screenshot) as image:
+        return np.asarray(image.convert('RGB'))
+
+
+class VisualDiff:
+    """Result of comparing a screenshot with its baseline.
+
+    Args:
+        name (str): Baseline name
+        baseline (str): Baseline file
+        pixels (int): Number of different pixels
+        ratio (float): Ratio of different pixels
+        passed (bool): Whether the ratio is within `max_ratio` of the baselines
+        diff (str): Diff image file. Defaults to None.
+        new (bool): Whether the baseline is created from the screenshot. Defaults to False.
+    """
+
+    def __init__(self, name, baseline, pixels, ratio, passed, diff=None, new=False):
+        self.name = name
+        self.baseline = baseline
+        self.pixels = pixels
+        self.ratio = ratio
+        self.passed = passed
+        self.diff = diff
+        self.new = new
+
+    def __bool__(self):
+        return self.passed
+
+    def __repr__(self):
+        return f'VisualDiff(name={self.name!r}, pixels={self.pixels}, ratio={self.ratio}, passed={self.passed})'
+
+
+class VisualBaselines:
+    """Compare screenshots with baselines, stored as `.npy` arrays in `root`.
+
+    Baselines are memory-mapped and cached, also in each process of `compare_many()` (kept until `close()`),
+    so repeated comparisons only read the pages of the baseline they touch.
+    A pixel is different when any channel differs by more than `tolerance`.
+    A missing baseline is created from the first screenshot compared with it.
+
+    Requires NumPy and Pillow (`pip install spydr[images]`).
+
+    Args:
+        root (str): Directory of baselines
+
+    Keyword Arguments:
+        tolerance (int): Maximum difference (0 to 255) of each channel of the same pixel. Defaults to 0.
+        max_ratio (float): Maximum ratio of different pixels to pass. Defaults to 0.0.
+        diff_root (str): Directory of diff images (relative to `root`), written when failed. Defaults to 'diffs'.
+            When set to None, diff images are not written.
+        max_workers (int): Number of processes of `compare_many()`. Defaults to None (number of CPUs).
+
+    Raises:
+        WebDriverException: Raise an error when NumPy or Pillow is not installed
+
+    Examples:
+        | baselines = VisualBaselines('baselines', tolerance=8, max_ratio=0.001)
+        | baselines.compare('home', s.get_screenshot_as_png(), ignore=[(0, 0, 200, 40)])
+        | s.compare_screenshot(baselines, 'home', ignore=['#clock'])
+        | baselines.compare_many([('home', 'screens/home.png'), ('cart', 'screens/cart.png')])
+    """
+
+    def __init__(self, root, tolerance=0, max_ratio=0.0, diff_root='diffs', max_workers=None):
+        _require()
+        self.root = Utils.to_abspath(root, isdir=True)
+        self.tolerance = tolerance
+        self.max_ratio = max_ratio
+        self.diff_root = diff_root and Utils.to_abspath(diff_root, root=self.root, mkdir=False, isdir=True)
+        self.max_workers = max_workers
+        self.__executor = None
+
+    def close(self):
+        """Shut down the processes of `compare_many()`."""
+        if self.__executor is not None:
+            self.__executor.shutdown()
+            self.__executor = None
+
+    def compare(self, name, screenshot, ignore=None):
+        """Compare the screenshot with the baseline of the name.
+
+        Args:
+            name (str): Baseline name, like 'login/home'
+            screenshot (bytes/str/numpy.ndarray): Binary data of the image, image file, or array
+
+        Keyword Arguments:
+            ignore (list[dict/tuple]): Regions to ignore in image pixels,
+                as {'x', 'y', 'width', 'height'} (like `rect`) or (x, y, width, height). Defaults to None.
+
+        Returns:
+            VisualDiff: Result of the comparison
+        """
+        return _compare(name, self.path(name), screenshot, self.tolerance, self.max_ratio,
+                        ignore, self._diff_path(name))
+
+    def compare_many(self, comparisons):
+        """Compare screenshots with their baselines in a process pool.
+
+        Args:
+            comparisons (list[tuple]): (name, screenshot) or (name, screenshot, ignore).
+                Prefer image files as screenshots, so only paths are sent to the processes.
+
+        Returns:
+            list[VisualDiff]: Results in the order of comparisons
+        """
+        if self.__executor is None:
+            self.__executor = ProcessPoolExecutor(self.max_workers)
+
+        futures = [
+            self.__executor.submit(_compare, name, self.path(name), screenshot, self.tolerance, self.max_ratio,
+                                   ignore[0] if ignore else None, self._diff_path(name))
+            for name, screenshot, *ignore in comparisons
+        ]
+        return [future.result() for future in futures]
+
+    def load(self, name):
+        """Load the baseline of the name, memory-mapped.
+
+        Args:
+            name (str): Baseline name
+
+        Returns:
+            numpy.ndarray: Read-only array or None if there is no baseline
+        """
+        path = self.path(name)
+        return _load(path, os.stat(path).st_mtime_ns) if os.path.isfile(path) else None
+
+    def path(self, name):
+        """Get the baseline file of the name.
+
+        Args:
+            name (str): Baseline name
+
+        Returns:
+            str: Absolute path of the `.npy` file
+        """
+        return Utils.to_abspath(name, suffix='.npy', root=self.root, mkdir=False)
+
+    def save(self, name, screenshot):
+        """Save the screenshot as the baseline of the name, replacing the existing one.
+
+        Args:
+            name (str): Baseline name
+            screenshot (bytes/str/numpy.ndarray): Binary data of the image, image file, or array
+
+        Returns:
+            str: Absolute path of the `.npy` file
+        """
+        return _save(self.path(name), to_array(screenshot))
+
+    def _diff_path(self, name):
+        if not self.diff_root:
+            return None
+
+        return Utils.to_abspath(name, suffix='.png', root=self.diff_root, mkdir=False)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __repr__(self):
+        return f'VisualBaselines({self.root!r}, tolerance={self.tolerance}, max_ratio={self.max_ratio})'
+
+
+def _compare(name, path, screenshot, tolerance, max_ratio, ignore, diff_path):
+    # Module-level, so it runs in worker processes with their own cache of memory-mapped baselines.
+    actual = to_array(screenshot)
+
+    if not os.path.isfile(path):
+        _save(path, actual)
+        return VisualDiff(name, path, 0, 0.0, True, new=True)
+
+    expected = _load(path, os.stat(path).st_mtime_ns)
+    height, width = max(expected.shape[0], actual.shape[0]), max(expected.shape[1], actual.shape[1])
+    overlap_height, overlap_width = min(expected.shape[0], actual.shape[0]), min(expected.shape[1], actual.shape[1])
+
+    # Pixels outside the overlap of different sizes are different.
+    different = np.ones((height, width), dtype=bool)
+    overlap = (slice(0, overlap_height), slice(0, overlap_width))
+    delta = np.abs(expected[overlap].astype(np.int16) - actual[overlap].astype(np.int16))
+    different[overlap] = delta.max(axis=2) > tolerance
+
+    for region in ignore or ():
+        if isinstance(region, dict):
+            region = (region['x'], region['y'], region['width'], region['height'])
+
+        x, y, w, h = region
+        top, left = max(math.floor(y), 0), max(math.floor(x), 0)
+        different[top:max(math.ceil(y + h), top), left:max(math.ceil(x + w), left)] = False
+
+    pixels = int(np.count_nonzero(different))
+    ratio = pixels / different.size
+    passed = ratio <= max_ratio
+
+    if passed or diff_path is None:
+        return VisualDiff(name, path, pixels, ratio, passed)
+
+    # Diff image: the dimmed baseline (or screenshot where it is larger) with different pixels in red.
+    image = np.full((height, width, 3), 255, dtype=np.uint8)
+    image[:actual.shape[0], :actual.shape[1]] = actual
+    image[:expected.shape[0], :expected.shape[1]] = expected
+    image = (image // 3 + 170).astype(np.uint8)
+    image[different] = (255, 0, 0)
+    os.makedirs(os.path.dirname(diff_path), exist_ok=True)
+    Image.fromarray(image).save(diff_path)
+    return VisualDiff(name, path, pixels, ratio, passed, diff=diff_path)
+
+
+@lru_cache(maxsize=1024)
+def _load(path, mtime_ns):
+    # Keyed by modification time, so a saved baseline is mapped again.
+    return np.load(path, mmap_mode='r')
+
+
+def _require():
+    if np is None or Image is None:
+        raise WebDriverException('NumPy and Pillow are required for visual diffs: pip install spydr[images]')
+
+
+def _save(path, array):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    np.save(path, np.ascontiguousarray(array, dtype=np.uint8))
+    return path
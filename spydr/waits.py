@@ -0,0 +1,233 @@
+import threading
+import time
+
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.support.ui import WebDriverWait
+
+
+class PollStrategy:
+    """Base class of poll strategies, which decide how long to sleep between condition checks.
+
+    Subclass it and implement `intervals()`, and optionally `observe()` to learn from condition latencies.
+    """
+
+    def intervals(self, key=None):
+        """Intervals (in seconds) to sleep between condition checks.
+
+        Keyword Arguments:
+            key (str): Key of the condition, like the qualified name of the waited method. Defaults to None.
+
+        Returns:
+            iterator[float]: Intervals in seconds
+        """
+        raise NotImplementedError
+
+    def observe(self, key, seconds):
+        """Called with the time it took for the condition to be met.
+
+        Args:
+            key (str): Key of the condition
+            seconds (float): Seconds until the condition was met
+        """
+
+
+class FixedPoll(PollStrategy):
+    """Sleep the same interval between condition checks, like WebDriverWait.
+
+    Keyword Arguments:
+        interval (float): Interval in seconds. Defaults to 0.5.
+    """
+
+    def __init__(self, interval=0.5):
+        self.interval = interval
+
+    def intervals(self, key=None):
+        while True:
+            yield self.interval
+
+    def __repr__(self):
+        return f'FixedPoll(interval={self.interval})'
+
+
+class BackoffPoll(PollStrategy):
+    """Start polling fast and back off exponentially, so short waits resolve in tens of milliseconds
+    while long waits don't hammer the driver.
+
+    Keyword Arguments:
+        initial (float): First interval in seconds. Defaults to 0.01.
+        factor (float): Multiplier of each next interval. Defaults to 2.
+        maximum (float): Maximum interval in seconds. Defaults to 0.5.
+    """
+
+    def __init__(self, initial=0.01, factor=2, maximum=0.5):
+        self.initial = initial
+        self.factor = factor
+        self.maximum = maximum
+
+    def intervals(self, key=None):
+        interval = self.initial
+
+        while True:
+            yield interval
+            interval = min(interval * self.factor, self.maximum)
+
+    def __repr__(self):
+        return f'BackoffPoll(initial={self.initial}, factor={self.factor}, maximum={self.maximum})'
+
+
+class LearnedPoll(PollStrategy):
+    """Poll at an interval learned from how long each condition usually takes.
+
+    The latency of each condition (by key) is tracked as an exponentially weighted moving average,
+    and the condition is polled `polls` times over that latency.
+    Conditions without history back off exponentially from `minimum`.
+
+    Keyword Arguments:
+        minimum (float): Minimum interval in seconds. Defaults to 0.01.
+        maximum (float): Maximum interval in seconds. Defaults to 0.5.
+        polls (int): Number of polls over the learned latency. Defaults to 8.
+        alpha (float): Weight of the latest latency in the moving average. Defaults to 0.3.
+    """
+
+    def __init__(self, minimum=0.01, maximum=0.5, polls=8, alpha=0.3):
+        self.minimum = minimum
+        self.maximum = maximum
+        self.polls = polls
+        self.alpha = alpha
+        self.latencies = {}
+        self.__lock = threading.Lock()
+
+    def intervals(self, key=None):
+        latency = self.latencies.get(key)
+
+        if latency is None:
+            yield from BackoffPoll(self.minimum, 2, self.maximum).intervals(key)
+        else:
+            yield from FixedPoll(min(max(latency / self.polls, self.minimum), self.maximum)).intervals(key)
+
+    def observe(self, key, seconds):
+        with self.__lock:
+            latency = self.latencies.get(key)
+            self.latencies[key] = seconds if latency is None else self.alpha * seconds + (1 - self.alpha) * latency
+
+    def __repr__(self):
+        return f'LearnedPoll(minimum={self.minimum}, maximum={self.maximum}, polls={self.polls}, alpha={self.alpha})'
+
+
+POLL_STRATEGIES = {
+    'backoff': BackoffPoll,
+    'fixed': FixedPoll,
+    'learned': LearnedPoll
+}
+"""dict: Poll strategies by name"""
+
+
+def to_poll_strategy(strategy):
+    """Get the poll strategy by name, or the given PollStrategy.
+
+    Args:
+        strategy (str/PollStrategy): 'backoff', 'fixed', 'learned', PollStrategy, or None
+
+    Raises:
+        WebDriverException: Raise an error when the strategy is not supported
+
+    Returns:
+        PollStrategy: PollStrategy or None
+    """
+    if strategy is None or isinstance(strategy, PollStrategy):
+        return strategy
+
+    if strategy not in POLL_STRATEGIES:
+        raise WebDriverException(f'Poll strategy must be one of {tuple(POLL_STRATEGIES)}: {strategy}')
+
+    return POLL_STRATEGIES[strategy]()
+
+
+class SpydrWait(WebDriverWait):
+    """WebDriverWait with pluggable poll strategies.
+
+    When `poll_frequency` is given, it polls at the fixed frequency like WebDriverWait.
+    Otherwise, it polls by `strategy`, or by the class attribute `strategy`, or every 0.5 seconds.
+    The condition is always checked once more at the timeout, instead of sleeping past it.
+
+    Args:
+        driver (WebDriver): WebDriver instance
+        timeout (float): Seconds before timing out
+
+    Keyword Arguments:
+        poll_frequency (float): Fixed sleep interval between calls. Defaults to None.
+        ignored_exceptions (list[Exception]): Exception classes to ignore during calls. Defaults to None.
+        strategy (str/PollStrategy): 'backoff', 'fixed', 'learned', or PollStrategy. Defaults to None.
+            A strategy by name is created for this wait, so 'learned' only learns across waits as a shared LearnedPoll.
+
+    Examples:
+        | SpydrWait(driver, 10, strategy='backoff').until(lambda wd: wd.find_element('id', 'someId'))
+        | SpydrWait(driver, 10, strategy=learned).until(lambda wd: wd.find_element('id', 'someId')) # learned = LearnedPoll()
+    """
+
+    strategy = None
+    """PollStrategy: Default poll strategy"""
+
+    def __init__(self, driver, timeout, poll_frequency=None, ignored_exceptions=None, strategy=None):
+        super().__init__(driver, timeout, poll_frequency or 0.5, ignored_exceptions)
+
+        if strategy is not None:
+            self.strategy = to_poll_strategy(strategy)
+        elif poll_frequency is not None or self.strategy is None:
+            self.strategy = FixedPoll(self._poll)
+
+    def until(self, method, message=''):
+        screen = None
+        stacktrace = None
+        key = self._key(method)
+        intervals = self.strategy.intervals(key)
+        start_time = time.monotonic()
+        end_time = start_time + self._timeout
+
+        while True:
+            try:
+                value = method(self._driver)
+                if value:
+                    self.strategy.observe(key, time.monotonic() - start_time)
+                    return value
+            except self._ignored_exceptions as exc:
+                screen = getattr(exc, 'screen', None)
+                stacktrace = getattr(exc, 'stacktrace', None)
+
+            remaining = end_time - time.monotonic()
+
+            if remaining <= 0:
+                break
+
+            time.sleep(min(next(intervals), remaining))
+
+        raise TimeoutException(message, screen, stacktrace)
+
+    def until_not(self, method, message=''):
+        key = self._key(method)
+        intervals = self.strategy.intervals(key)
+        start_time = time.monotonic()
+        end_time = start_time + self._timeout
+
+        while True:
+            try:
+                value = method(self._driver)
+                if not value:
+                    self.strategy.observe(key, time.monotonic() - start_time)
+                    return value
+            except self._ignored_exceptions:
+                return True
+
+            remaining = end_time - time.monotonic()
+
+            if remaining <= 0:
+                break
+
+            time.sleep(min(next(intervals), remaining))
+
+        raise TimeoutException(message)
+
+    def _key(self, method):
+        # Conditions are keyed by the waited method, like 'Spydr.wait_until_displayed.<locals>.<lambda>'
+        method = getattr(method, '__wrapped__', method)
+        return getattr(method, '__qualname__', None) or type(method).__qualname__
@@ -2,16 +2,19 @@ import base64
 import inspect
 import json
 import logging
+import math
 import os
 import platform
+import random
 import re
 import string
+import sys
 import urllib.parse
 import zipfile
 
 from datetime import datetime, timedelta
 from dateutil import tz
-from functools import wraps
+from functools import lru_cache, partial, wraps
 from io import BytesIO
 from selenium import webdriver
 from selenium.common.exceptions import ElementClickInterceptedException
@@ -27,15 +30,256 @@ from selenium.common.exceptions import WebDriverException
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.alert import Alert
 from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.remote.command import Command
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support import expected_conditions
-from selenium.webdriver.support.ui import WebDriverWait
-from time import strftime, localtime
+from time import perf_counter, strftime, localtime
 from webdriver_manager.chrome import ChromeDriverManager
 from webdriver_manager.firefox import GeckoDriverManager
 from webdriver_manager.microsoft import IEDriverManager, EdgeChromiumDriverManager
 
-from .utils import INI, HOWS, Utils, YML
+from .downloads import DownloadWatcher, completed_files
+from .metrics import Metrics
+from .screenshots import FORMATS, ScreenshotStore, ScreenshotWriter, crop_screenshots, write_screenshot
+from .tracing import Tracer
+from .utils import INI, HOWS, LocatorCache, Utils, YML
+from .waits import LearnedPoll, SpydrWait, to_poll_strategy
+
+
+# Resolve `arguments[0]` (how) and `arguments[1]` (what) to `elements` within `arguments[2]` (root) in the page.
+# `what` can also be a list of WebElement, and the remaining arguments are available as `args`.
+_ELEMENTS_SCRIPT = r'''
+    let elements = (function (how, what, root) {
+        if (Array.isArray(what)) {
+            return what;
+        }
+
+        root = root || document;
+
+        let css = function (selector) {
+            return Array.prototype.slice.call(root.querySelectorAll(selector));
+        };
+        let quote = function (value) {
+            return '"' + String(value).replace(/\\/g, '\\\\').replace(/"/g, '\\"') + '"';
+        };
+
+        switch (how) {
+            case 'css selector':
+            case 'tag name':
+                return css(what);
+            case 'class name':
+                return css('[class~=' + quote(what) + ']');
+            case 'id':
+                return css('[id=' + quote(what) + ']');
+            case 'name':
+                return css('[name=' + quote(what) + ']');
+            case 'link text':
+            case 'partial link text':
+                return css('a').filter(function (link) {
+                    let text = link.innerText.trim();
+                    return how === 'link text' ? text === what : text.indexOf(what) > -1;
+                });
+            case 'xpath': {
+                let snapshot = document.evaluate(what, root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+                let nodes = [];
+                for (let i = 0; i < snapshot.snapshotLength; i++) {
+                    if (snapshot.snapshotItem(i).nodeType === Node.ELEMENT_NODE) {
+                        nodes.push(snapshot.snapshotItem(i));
+                    }
+                }
+                return nodes;
+            }
+        }
+
+        return [];
+    })(arguments[0], arguments[1], arguments[2]);
+    let args = Array.prototype.slice.call(arguments, 3);
+'''
+
+# Values of `options` by `value`, `text` (whitespace collapsed and trimmed, close to WebElement.text), or `index`.
+_OPTIONS_SCRIPT = r'''
+    let optionValues = function (options, by) {
+        return options.map(function (option) {
+            if (by === 'text') {
+                return option.text.replace(/\s+/g, ' ').trim();
+            }
+            return by === 'index' ? option.index : option.value;
+        });
+    };
+'''
+
+_OPTION_BYS = ('value', 'text', 'index')
+
+# Dispatch bubbling `input` and `change` events on `element`, by `document.createEvent` in IE (no `Event` constructor).
+_CHANGE_EVENTS_SCRIPT = r'''
+    let dispatchChange = function (element) {
+        ['input', 'change'].forEach(function (type) {
+            let event;
+            if (typeof Event === 'function') {
+                event = new Event(type, {bubbles: true});
+            } else {
+                event = document.createEvent('HTMLEvents');
+                event.initEvent(type, true, false);
+            }
+            element.dispatchEvent(event);
+        });
+    };
+'''
+
+# Whether `element` is displayed, close to WebElement.is_displayed().
+_DISPLAYED_SCRIPT = r'''
+    let isDisplayed = function (element) {
+        let style = window.getComputedStyle(element);
+        return element.getClientRects().length > 0 &&
+            style.visibility !== 'hidden' && style.visibility !== 'collapse' && parseFloat(style.opacity) !== 0;
+    };
+'''
+
+# Visible text of `element`, close to WebElement.text: empty when not rendered, and `&nbsp;` as space.
+_VISIBLE_TEXT_SCRIPT = r'''
+    let visibleText = function (element) {
+        return element.getClientRects().length ? element.innerText.replace(/\u00a0/g, ' ') : '';
+    };
+'''
+
+# 53-bit digest (cyrb53) of `text`, as a number that fits in JSON without rounding.
+_DIGEST_SCRIPT = r'''
+    let digest = function (text) {
+        let h1 = 0xdeadbeef, h2 = 0x41c6ce57;
+        for (let i = 0; i < text.length; i++) {
+            let ch = text.charCodeAt(i);
+            h1 = Math.imul(h1 ^ ch, 2654435761);
+            h2 = Math.imul(h2 ^ ch, 1597334677);
+        }
+        h1 = Math.imul(h1 ^ (h1 >>> 16), 2246822507) ^ Math.imul(h2 ^ (h2 >>> 13), 3266489909);
+        h2 = Math.imul(h2 ^ (h2 >>> 16), 2246822507) ^ Math.imul(h1 ^ (h1 >>> 13), 3266489909);
+        return 4294967296 * (2097151 & h2) + (h1 >>> 0);
+    };
+'''
+
+# Pending fetch and XMLHttpRequest calls, counted in `window.__spydrAjax` once installed in the page.
+_AJAX_TRACKER_SCRIPT = r'''
+    if (!window.__spydrAjax) {
+        let ajax = window.__spydrAjax = {pending: 0, last: Date.now()};
+        let start = function () {
+            ajax.pending++;
+            ajax.last = Date.now();
+        };
+        let end = function () {
+            ajax.pending = Math.max(ajax.pending - 1, 0);
+            ajax.last = Date.now();
+        };
+        let send = XMLHttpRequest.prototype.send;
+        XMLHttpRequest.prototype.send = function () {
+            start();
+            this.addEventListener('loadend', end);
+            try {
+                return send.apply(this, arguments);
+            } catch (error) {
+                this.removeEventListener('loadend', end);
+                end();
+                throw error;
+            }
+        };
+        if (window.fetch) {
+            let fetch = window.fetch;
+            window.fetch = function () {
+                start();
+                return fetch.apply(this, arguments).then(function (response) {
+                    end();
+                    return response;
+                }, function (error) {
+                    end();
+                    throw error;
+                });
+            };
+        }
+    }
+'''
+
+# Rects ([x, y, width, height] in CSS pixels) of `elements` in the viewport, or in the page when `page` is true.
+_RECTS_SCRIPT = r'''
+    let rects = function (elements, page) {
+        return elements.map(function (element) {
+            let rect = element.getBoundingClientRect();
+            return [
+                rect.left + (page ? window.pageXOffset : 0), rect.top + (page ? window.pageYOffset : 0),
+                rect.width, rect.height
+            ];
+        });
+    };
+'''
+
+
+# Public methods of Spydr (or its subclass) to decorate for debugging
+@lru_cache(maxsize=None)
+def _decorated_method_names(cls):
+    names = []
+
+    for klass in reversed(cls.__mro__):
+        for name, value in vars(klass).items():
+            if inspect.isfunction(value) and not name.startswith('_') and name not in names:
+                names.append(name)
+
+    return tuple(name for name in names if name not in ('debug', 'info', 't'))
+
+
+# Subclass of SpydrElement (or its subclass) with public methods decorated for metrics and tracer, created once
+@lru_cache(maxsize=None)
+def _instrumented_element_class(cls):
+    if vars(cls).get('_instrumented'):
+        return cls
+
+    def decorate(fn):
+        name = fn.__name__
+
+        @wraps(fn)
+        def wrapper(self, *args, **kwargs):
+            metrics, tracer = self.spydr.metrics, self.spydr.tracer
+            start = perf_counter()
+            try:
+                if tracer is None:
+                    return fn(self, *args, **kwargs)
+
+                with tracer.span(name, 'element', lambda: tracer.format_args(args, kwargs, name, 'element')):
+                    return fn(self, *args, **kwargs)
+            finally:
+                if metrics is not None:
+                    metrics.observe('element', name, perf_counter() - start)
+        return wrapper
+
+    methods = {name: decorate(getattr(cls, name)) for name in _decorated_method_names(cls)}
+    return type(cls.__name__, (cls,), {'__module__': cls.__module__, '__qualname__': cls.__qualname__,
+                                       '_instrumented': True, **methods})
+
+
+# Timeouts applied to WebDriver
+class _Timeouts:
+    _SETTERS = {
+        'implicit': 'implicitly_wait',
+        'pageLoad': 'set_page_load_timeout',
+        'script': 'set_script_timeout'
+    }
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.applied = {}
+
+    def set(self, **timeouts):
+        # Skip timeouts already applied, and send the rest in one W3C command
+        changes = {name: seconds for name, seconds in timeouts.items()
+                   if seconds is not None and self.applied.get(name) != seconds}
+
+        if not changes:
+            return
+
+        if getattr(self.driver, 'w3c', True):
+            self.driver.execute(Command.SET_TIMEOUTS, {name: int(float(seconds) * 1000) for name, seconds in changes.items()})
+        else:
+            for name, seconds in changes.items():
+                getattr(self.driver, self._SETTERS[name])(seconds)
+
+        self.applied.update(changes)
 
 
 # localStorage and sessionStorage
@@ -142,10 +386,18 @@ class Spydr:
              headless=False, \
              ini=None, \
              locale='en', \
+             locator_cache_size=1024, \
              log_indent=2, \
              log_level=None, \
+             metrics=None, \
+             network_events=False, \
+             observer_waits=False, \
+             poll_strategy=None, \
              screen_root='./screens', \
+             screenshot_store=None, \
+             screenshot_writer=None, \
              timeout=30, \
+             tracer=None, \
              whitelist=None, \
              window_size='1280,720', \
              yml=None)
@@ -161,12 +413,34 @@ class Spydr:
         headless (bool): Headless mode. Defaults to False.
         ini (str/INI): INI File. Defaults to None.
         locale (str): Browser locale. Defaults to 'en'.
+        locator_cache_size (int): Maximum number of parsed locators to cache. Defaults to 1024.
+            Cache statistics are available in `locator_cache.info()`.
         log_indent (int): Indentation for logging messages. Defaults to 2.
         log_level (str): Logging level: 'INFO' or 'DEBUG'. Defaults to None.
             When set to 'INFO', `info()` messages will be shown.
             When set to 'DEBUG', `debug()`, `info()` and called methods will be shown.
+        metrics (bool/str/Metrics): Record latency histograms of Spydr methods, SpydrElement methods,
+            and WebDriver commands. Defaults to None.
+            When set to True, metrics are kept in memory (`metrics.summary()`).
+            When set to a file path, metrics are also saved to the file at `quit()`.
+        network_events (bool): Record Chrome DevTools Network events in performance logs,
+            for `wait_until_network_idle()` (only Chrome). Defaults to False.
+        observer_waits (bool): Resolve element `wait_until_*` methods in the page with MutationObserver,
+            instead of polling every 0.5 seconds. Falls back to polling when async scripts fail. Defaults to False.
+        poll_strategy (str/PollStrategy): How waits poll: 'fixed' (every 0.5 seconds), 'backoff' (from 10ms to 0.5 seconds),
+            'learned' (from the usual latency of each condition), or PollStrategy. Defaults to None ('fixed').
         screen_root (str): The directory of saved screenshots. Defaults to './screens'.
+        screenshot_store (bool/str/ScreenshotStore): Store each unique screenshot once, by content hash,
+            with a manifest of screenshot names (like 'login/step1.png'). Defaults to None.
+            When set to True, screenshots are stored under screen_root. When set to a directory, under it.
+            Use `ScreenshotStore(root, perceptual=True)` to also collapse near-duplicates (requires Pillow).
+        screenshot_writer (bool/ScreenshotWriter): Decode and write screenshots on background threads,
+            so `save_screenshot()` returns a Future right after capturing. Defaults to None.
+            Pending screenshots are written at `quit()`.
         timeout (int): Timeout for implicitly_wait, page_load_timeout, and script_timeout. Defaults to 30.
+        tracer (str/Tracer): Trace nested spans of Spydr methods, waits, polls, and WebDriver commands. Defaults to None.
+            When set to a file path, spans are written in Chrome Trace Event format (or JSONL for `.jsonl`).
+            Use `Tracer(file, sample_rate=0.1)` to trace a sample of calls. The file is closed at `quit()`.
         whitelist (str): URLs to whitelist (only Chrome/Firefox). An example of whitelist is 'google.com, apple.com'. Defaults to None.
         window_size (str): The size of the window when headless. Defaults to '1280,720'.
         yml (str/bytes/os.PathLike/YML): YAML File. Defaults to None.
@@ -183,8 +457,8 @@ class Spydr:
     keys = Keys
     """selenium.webdriver.common.keys.Keys: Pre-defined keys codes"""
 
-    wait = WebDriverWait
-    """selenium.webdriver.support.ui.WebDriverWait: WebDriverWait"""
+    wait = SpydrWait
+    """spydr.waits.SpydrWait: WebDriverWait with pluggable poll strategies"""
 
     def __init__(self,
                  auth_username=None,
@@ -194,10 +468,18 @@ class Spydr:
                  headless=False,
                  ini=None,
                  locale='en',
+                 locator_cache_size=1024,
                  log_indent=2,
                  log_level=None,
+                 metrics=None,
+                 network_events=False,
+                 observer_waits=False,
+                 poll_strategy=None,
                  screen_root='./screens',
+                 screenshot_store=None,
+                 screenshot_writer=None,
                  timeout=30,
+                 tracer=None,
                  whitelist=None,
                  window_size='1280,720',
                  yml=None):
@@ -208,14 +490,31 @@ class Spydr:
         self.headless = headless
         self.ini = ini
         self.log_indent = log_indent if isinstance(log_indent, int) else 2
-        self.log_level = logging.getLevelName(log_level) if log_level in ['DEBUG', 'INFO'] else 50
+        self.network_events = network_events
+        self.observer_waits = observer_waits
+        self.__learned_poll = None
+        self.__metrics = None
+        self.downloads = None
+        self.__network_activity = 0
+        self.__network_requests = {}
+        self.__poll_strategy = None
+        self.__screenshot_store = None
+        self.__screenshot_writer = None
+        self.__tracer = None
+        self.log_level = log_level
         self.screen_root = screen_root
         self.whitelist = whitelist
         self.window_size = window_size
+        self.locator_cache = LocatorCache(locator_cache_size)
         self.yml = yml
         self.locale = self._format_locale(locale)
         self.driver = self._get_webdriver()
         self.logger = self._get_logger()
+        self.metrics = metrics
+        self.poll_strategy = poll_strategy
+        self.screenshot_store = screenshot_store
+        self.screenshot_writer = screenshot_writer
+        self.tracer = tracer
         self.timeout = timeout
         self.local_storage = _Storage(self.driver, 'localStorage')
         self.session_storage = _Storage(self.driver, 'sessionStorage')
@@ -358,7 +657,7 @@ class Spydr:
             if not self._is_checkbox_or_radio_clicked(element):
                 raise WebDriverException(f'Failed to click on the element: {locator}')
 
-    def checkboxes_to_be(self, locator, is_checked, on_values=None):
+    def checkboxes_to_be(self, locator, is_checked, on_values=None, batch=False):
         """Set all checkboxes, identified by the locator, to the given state (is_checked).
 
         Args:
@@ -368,10 +667,21 @@ class Spydr:
         Keyword Arguments:
             on_values (list/tuple): When given, only checkboxes with values in the list are set to `is_checked`
                 while others are set to `not is_checked`. Defaults to None.
+            batch (bool): Set and verify all checkboxes in one script call.
+                Checkboxes are clicked by `HTMLElement.click()`, which fires input and change events. Defaults to False.
+
+        Raises:
+            InvalidSelectorException: Raise an error when an element is not a checkbox
+            WebDriverException: Raise an error, with the indexes and values of failed checkboxes, when failing to set the given state
         """
-        elements = self.find_elements(locator)
         on_values = [str(item) for item in on_values] if isinstance(on_values, (list, tuple)) else None
 
+        if batch:
+            self._checkboxes_to_be(locator, is_checked, on_values)
+            return
+
+        elements = self.find_elements(locator)
+
         for element in elements:
             if on_values and element.value.strip() not in on_values:
                 self.checkbox_to_be(element, not is_checked)
@@ -501,6 +811,47 @@ class Spydr:
         """
         return self.find_element(locator).closest(parent_locator)
 
+    def compare_screenshot(self, baselines, name, ignore=None, full_page=False):
+        """Compare a screenshot of the current window with its baseline.
+
+        Args:
+            baselines (VisualBaselines): Baselines to compare with
+            name (str): Baseline name, like 'login/home'
+
+        Keyword Arguments:
+            ignore (list[str/WebElement/dict/tuple]): Locators or elements to ignore, or regions in CSS pixels
+                of the captured area, as {'x', 'y', 'width', 'height'} or (x, y, width, height). Defaults to None.
+            full_page (bool): Compare a screenshot of the full page (`get_full_page_screenshot_as_png()`).
+                Defaults to False.
+
+        Returns:
+            VisualDiff: Result of the comparison
+
+        Examples:
+            | baselines = VisualBaselines('baselines', tolerance=8)
+            | assert s.compare_screenshot(baselines, 'home', ignore=['#clock', '.ad'])
+        """
+        png = self.get_full_page_screenshot_as_png() if full_page else self.get_screenshot_as_png()
+        regions = []
+        elements = []
+
+        for region in ignore or ():
+            if isinstance(region, dict):
+                regions.append((region['x'], region['y'], region['width'], region['height']))
+            elif isinstance(region, (tuple, list)):
+                regions.append(region)
+            else:
+                elements.extend(self.find_elements(region) if isinstance(region, str) else [region])
+
+        # Regions are scaled from CSS pixels to image pixels by devicePixelRatio.
+        page = self.execute_script(f'''
+            {_RECTS_SCRIPT}
+            return {{ ratio: window.devicePixelRatio || 1, rects: rects(arguments[0], arguments[1]) }};
+        ''', elements, full_page)
+        regions = [tuple(value * page['ratio'] for value in region) for region in regions + page['rects']]
+
+        return baselines.compare(name, png, ignore=regions)
+
     def copy_and_paste(self, locator, text):
         """Copy text to clipboard and paste it (send_keys) to the element. (Chrome only)
 
@@ -747,6 +1098,9 @@ class Spydr:
     @driver.setter
     def driver(self, driver_):
         self.__driver = driver_
+        self.__ajax_windows = set()
+        self.__timeouts = _Timeouts(driver_)
+        self._instrument_driver()
 
     def execute_async_script(self, script, *args):
         """Asynchronously execute JavaScript in the current window or frame.
@@ -820,28 +1174,7 @@ class Spydr:
         Returns:
             WebElement: The element found
         """
-        if isinstance(locator, WebElement):
-            return locator
-
-        element = None
-        how, what = self._parse_locator(locator)
-
-        if how == HOWS['css']:
-            matched = re.search(r'(.*):eq\((\d+)\)', what)
-            if matched:
-                new_what, index = matched.group(1, 2)
-                try:
-                    element = self.find_elements(f'css={new_what}')[int(index)]
-                except IndexError:
-                    raise NoSuchElementException(f'{locator} does not have ":eq({index})" element')
-
-        if not element:
-            element = self.is_located(locator)
-
-            if not isinstance(element, WebElement):
-                raise NoSuchElementException(f'Cannot locate element in the given time using: {locator}')
-
-        return element
+        return self._find_element(locator)
 
     @_WebElementSpydrify()
     def find_elements(self, locator):
@@ -859,6 +1192,12 @@ class Spydr:
         how, what = self._parse_locator(locator)
         elements = self.driver.find_elements(how, what)
 
+        if not elements and self.implicitly_wait:
+            try:
+                elements = self.wait(self.driver, self.implicitly_wait).until(lambda wd: wd.find_elements(how, what))
+            except TimeoutException:
+                pass
+
         return elements
 
     def first_child(self, locator):
@@ -919,6 +1258,26 @@ class Spydr:
         """
         return self.driver.get_cookies()
 
+    def get_full_page_screenshot_as_base64(self):
+        """Get a screenshot of the full page, beyond the viewport, as a Base64 encoded string.
+
+        Captured in one command: DevTools `Page.captureScreenshot` on Chrome, and the full-page screenshot on Firefox.
+        Other browsers capture the current window (IE captures the full page already).
+
+        Returns:
+            str: Base64 encoded string of the screenshot
+        """
+        self.wait_until_page_loaded()
+        return self._get_screenshot(full_page=True)
+
+    def get_full_page_screenshot_as_png(self):
+        """Get a screenshot of the full page, beyond the viewport, as a binary data.
+
+        Returns:
+            bytes: Binary data of the screenshot
+        """
+        return base64.b64decode(self.get_full_page_screenshot_as_base64().encode('ascii'))
+
     def get_ini_key(self, key, section=None):
         """Get value of the given key from INI.
 
@@ -1110,6 +1469,9 @@ class Spydr:
     def implicitly_wait(self):
         """Timeout for implicitly wait.
 
+        Spydr waits for elements on the client side, so setting it does not send any WebDriver command,
+        and the WebDriver's own implicit wait is kept at 0.
+
         Returns:
             int: The timeout of implicitly wait
         """
@@ -1118,7 +1480,6 @@ class Spydr:
     @implicitly_wait.setter
     def implicitly_wait(self, seconds):
         self.__implicitly_wait = seconds
-        self.driver.implicitly_wait(seconds)
 
     def info(self, message):
         """Log **INFO** messages.
@@ -1156,16 +1517,12 @@ class Spydr:
         Returns:
             bool: Whether the element is displayed
         """
-        implicitly_wait = self.implicitly_wait
-        seconds = int(seconds) if seconds is not None else implicitly_wait
-        self.implicitly_wait = seconds
+        seconds = int(seconds) if seconds is not None else self.implicitly_wait
 
         try:
-            return self.find_element(locator).is_displayed()
+            return self._find_element(locator, seconds).is_displayed()
         except (NoSuchElementException, TimeoutException):
             return False
-        finally:
-            self.implicitly_wait = implicitly_wait
 
     def is_enabled(self, locator):
         """Check if the element is enabled.
@@ -1203,20 +1560,15 @@ class Spydr:
             False/WebElement: Return False if not located. Return WebElement if located.
         """
         how, what = self._parse_locator(locator)
-
-        implicitly_wait = self.implicitly_wait
-        seconds = seconds if seconds is not None else implicitly_wait
-
-        if seconds != implicitly_wait:
-            self.implicitly_wait = seconds
+        seconds = seconds if seconds is not None else self.implicitly_wait
 
         try:
+            if not seconds:
+                return self.driver.find_element(how, what)
+
             return self.wait(self.driver, seconds).until(lambda wd: wd.find_element(how, what))
         except (NoSuchElementException, NoSuchWindowException, StaleElementReferenceException, TimeoutException):
             return False
-        finally:
-            if seconds != implicitly_wait:
-                self.implicitly_wait = implicitly_wait
 
     def is_page_loaded(self):
         """Check if `document.readyState` is `complete`.
@@ -1347,6 +1699,23 @@ class Spydr:
         """
         return self.find_element(locator).location
 
+    @property
+    def log_level(self):
+        """Logging level.  When set to `logging.DEBUG` (or 'DEBUG'), called methods are logged.
+        Levels other than DEBUG and INFO are set to CRITICAL (50), like in `__init__`.
+
+        Returns:
+            int: Logging level
+        """
+        return self.__log_level
+
+    @log_level.setter
+    def log_level(self, level):
+        # Only DEBUG and INFO are supported. Other levels, like None or 'WARNING', are CRITICAL (50).
+        level = logging.getLevelName(level) if level in ['DEBUG', 'INFO'] else level
+        self.__log_level = level if level in [logging.DEBUG, logging.INFO] else 50
+        self._decorate_methods()
+
     def maximize_window(self):
         """Maximize the current window."""
         if not self.headless:
@@ -1363,6 +1732,30 @@ class Spydr:
         if not self.headless:
             self.driver.minimize_window()
 
+    @property
+    def metrics(self):
+        """Latency histograms of Spydr methods, SpydrElement methods, and WebDriver commands.
+
+        Set to True (in memory), a file path (saved at `quit()`), a Metrics instance, or None (disabled).
+
+        Returns:
+            Metrics: Metrics or None if disabled
+        """
+        return self.__metrics
+
+    @metrics.setter
+    def metrics(self, metrics):
+        if metrics is True:
+            metrics = Metrics()
+        elif isinstance(metrics, (str, bytes, os.PathLike)):
+            metrics = Metrics(metrics)
+        elif not isinstance(metrics, Metrics):
+            metrics = None
+
+        self.__metrics = metrics
+        self._instrument_driver()
+        self._decorate_methods()
+
     def move_by_offset(self, x_offset, y_offset):
         """Moving the mouse to an offset from current mouse position.
 
@@ -1548,7 +1941,7 @@ class Spydr:
     @page_load_timeout.setter
     def page_load_timeout(self, seconds):
         self.__page_load_timeout = seconds
-        self.driver.set_page_load_timeout(seconds)
+        self.__timeouts.set(pageLoad=seconds)
 
     @property
     def page_source(self):
@@ -1589,6 +1982,20 @@ class Spydr:
         """
         return Utils.path_exists(path)
 
+    @property
+    def poll_strategy(self):
+        """Poll strategy of waits: 'fixed', 'backoff', 'learned', or PollStrategy.
+
+        Returns:
+            PollStrategy: PollStrategy or None (polling every 0.5 seconds)
+        """
+        return self.__poll_strategy
+
+    @poll_strategy.setter
+    def poll_strategy(self, strategy):
+        self.__poll_strategy = to_poll_strategy(strategy)
+        self._instrument_wait()
+
     def previous_element(self, locator):
         """Get the previous element of the given element.
 
@@ -1601,9 +2008,25 @@ class Spydr:
         return self.find_element(locator).previous_element
 
     def quit(self):
-        """Quit the Spydr webdriver."""
+        """Quit the Spydr webdriver.  Pending screenshots are written, metrics are saved when `metrics` has a file,
+        and `screenshot_store`, `tracer` and `downloads` are closed."""
+        if self.screenshot_writer is not None:
+            self.screenshot_writer.close()
+
+        if self.screenshot_store is not None:
+            self.screenshot_store.close()
+
         self.driver.quit()
 
+        if self.metrics is not None and self.metrics.file:
+            self.metrics.save()
+
+        if self.tracer is not None:
+            self.tracer.close()
+
+        if self.downloads is not None:
+            self.downloads.close()
+
     def radio_to_be(self, locator, is_checked):
         """Set the radio button, identified by the locator, to the given state (is_checked).
 
@@ -1672,18 +2095,26 @@ class Spydr:
         """Refresh the current page."""
         self.driver.refresh()
 
-    def refresh_until_page_changed(self, frequency=2, timeout=10, body_text_diff=True):
+    def refresh_until_page_changed(self, frequency=2, timeout=10, body_text_diff=True, regions=None):
         """Refresh the page (every `frequency`) until the page changes or until `timeout`.
 
+        The content is compared by its digest computed in the page, so only a few bytes are transferred per refresh.
+
         Keyword Arguments:
             frequency (int): Refresh frequency
             timeout (int): Time allowed to refresh. Defaults to 10.
-            body_text_diff (bool): Compare `body` text when True.  Compare `page_source` when False.
+            body_text_diff (bool): Compare `body` text when True.  Compare the whole DOM when False.
+                With `regions`, compare the regions' text when True, or their HTML when False.
+            regions (list[str]): Locators of the regions to compare, instead of the whole page. Defaults to None.
 
         Returns:
-            bool: Whether the page is changed
+            bool/list[str]: Whether the page is changed. With `regions`, the locators of the changed regions.
+
+        Examples:
+            | refresh_until_page_changed(regions=['#status', '#total'])  # ['#status']
         """
-        return self.wait(self.driver, timeout, poll_frequency=frequency).until(lambda _: self._is_page_changed_after_refresh(body_text_diff))
+        return self.wait(self.driver, timeout, poll_frequency=frequency).until(
+            lambda _: self._is_page_changed_after_refresh(body_text_diff, regions))
 
     def remove_attribute(self, locator, attribute):
         """Remove the given attribute from the element.
@@ -1749,36 +2180,99 @@ class Spydr:
         with open(file_, "w") as cookie_file:
             json.dump(self.get_cookies(), cookie_file, indent=2)
 
+    def save_full_page_screenshot(self, filename, background=None, format='png', quality=None, scale=None):
+        """Save a screenshot of the full page, beyond the viewport, to filename (PNG by default).
+
+        Default directory for saved screenshots is defined in: screen_root.
+        See `get_full_page_screenshot_as_base64()` for how each browser captures the full page,
+        and `save_screenshot()` for `format`, `quality`, and `scale` (only Chromium).
+
+        Args:
+            filename (str): Filename of the screenshot
+
+        Keyword Arguments:
+            background (bool): Capture the screenshot, then decode and write it on `screenshot_writer`.
+                Defaults to None (background when `screenshot_writer` is set).
+            format (str): 'png', 'jpeg', or 'webp'. Defaults to 'png'.
+            quality (int): Compression quality from 0 to 100 ('jpeg' and 'webp'). Defaults to None.
+            scale (float): Scale of the image, like 0.5 for half width and height. Defaults to None.
+
+        Raises:
+            WebDriverException: Raise an error when the options are not supported by the browser
+
+        Returns:
+            bool/Future: Whether the file is saved, or Future resolved with it in background
+        """
+        self.wait_until_page_loaded()
+        filename = self._screenshot_path(filename, format)
+        screenshot = self._get_screenshot(format, quality, scale=scale, full_page=True)
+
+        return self._save_screenshot(screenshot, filename, background)
+
     def save_ini(self):
         """Save INI file."""
         if self.ini:
             self.ini.save()
 
-    def save_screenshot(self, filename):
-        """Save a screenshot of the current window to filename (PNG).
+    def save_screenshot(self, filename, background=None, format='png', quality=None, clip=None, scale=None):
+        """Save a screenshot of the current window to filename (PNG by default).
 
         Default directory for saved screenshots is defined in: screen_root.
+        `format`, `quality`, `clip`, and `scale` are captured by DevTools `Page.captureScreenshot` (only Chromium),
+        so cheap screenshots can be taken like `format='jpeg', quality=50, scale=0.5`.
 
         Args:
-            filename (str): Filename of the screenshot
+            filename (str): Filename of the screenshot. Suffixed by the format if missing.
+
+        Keyword Arguments:
+            background (bool): Capture the screenshot, then decode and write it on `screenshot_writer`.
+                Defaults to None (background when `screenshot_writer` is set).
+            format (str): 'png', 'jpeg', or 'webp'. Defaults to 'png'.
+            quality (int): Compression quality from 0 to 100 ('jpeg' and 'webp'). Defaults to None.
+            clip (dict/tuple): Rectangle of the page to capture, as {'x', 'y', 'width', 'height'} (like `rect`)
+                or (x, y, width, height) in CSS pixels. Defaults to None (the viewport).
+            scale (float): Scale of the image, like 0.5 for half width and height. Defaults to None.
+
+        Raises:
+            WebDriverException: Raise an error when the options are not supported by the browser
 
         Returns:
-            bool: Whether the file is saved
+            bool/Future: Whether the file is saved, or Future resolved with it in background
+
+        Examples:
+            | s.save_screenshot('step')
+            | s.save_screenshot('step', format='jpeg', quality=50, scale=0.5)
+            | s.save_screenshot('header', clip=s.rect('#header'))
         """
         self.wait_until_page_loaded()
-        return self.driver.save_screenshot(self.abspath(filename, suffix='.png', root=self.screen_root))
+        filename = self._screenshot_path(filename, format)
+        screenshot = self._get_screenshot(format, quality, clip, scale)
+
+        return self._save_screenshot(screenshot, filename, background)
 
-    def screenshot(self, locator, filename):
-        """Save a screenshot of the element to the filename (PNG).
+    def screenshot(self, locator, filename, background=None, format='png', quality=None, clip=None, scale=None):
+        """Save a screenshot of the element to the filename (PNG by default).
 
         Args:
             locator (str/WebElement): The locator to identify the element or WebElement
             filename ([type]): Filename of the screenshot
 
+        Keyword Arguments:
+            background (bool): Capture the screenshot, then decode and write it on `screenshot_writer`.
+                Defaults to None (background when `screenshot_writer` is set).
+            format (str): 'png', 'jpeg', or 'webp'. Defaults to 'png'.
+            quality (int): Compression quality from 0 to 100 ('jpeg' and 'webp'). Defaults to None.
+            clip (dict/tuple): Rectangle of the element to capture, relative to the element. Defaults to None.
+            scale (float): Scale of the image. Defaults to None.
+
+        Raises:
+            WebDriverException: Raise an error when the options are not supported by the browser
+
         Returns:
-            bool: Whether the file is saved
+            bool/Future: Whether the file is saved, or Future resolved with it in background
         """
-        return self.find_element(locator).save_screenshot(filename)
+        return self.find_element(locator).save_screenshot(
+            filename, background=background, format=format, quality=quality, clip=clip, scale=scale)
 
     def screenshot_as_base64(self, locator):
         """Get the screenshot of the element as a Base64 encoded string
@@ -1802,6 +2296,104 @@ class Spydr:
         """
         return self.find_element(locator).screenshot_as_png
 
+    def screenshot_elements(self, locator_or_list, directory, format='png', quality=None):
+        """Save screenshots of the elements, cropped from one screenshot of the full page.
+
+        Instead of an element screenshot command (which scrolls and renders) per element,
+        the rects of all elements are fetched in one script, the page is captured once
+        (see `get_full_page_screenshot_as_base64()`), and the elements are cropped on `screenshot_writer`.
+        Cropping requires Pillow.
+
+        Args:
+            locator_or_list (str/WebElement/list): The locator to identify the elements, WebElement, or list of them
+            directory (str): Directory of the screenshots in screen_root. Files are named by the index of the elements.
+
+        Keyword Arguments:
+            format (str): 'png', 'jpeg', or 'webp'. Defaults to 'png'.
+            quality (int): Compression quality from 0 to 100 ('jpeg' and 'webp'). Defaults to None.
+
+        Returns:
+            Future: Future resolved with the files of the elements in order (None if not saved),
+                or raising WebDriverException when Pillow is not installed
+
+        Examples:
+            | files = s.screenshot_elements('.card', 'cards').result()
+            | s.screenshot_elements(['#header', '#footer'], 'layout', format='jpeg', quality=80)
+        """
+        self.wait_until_page_loaded()
+        locators = locator_or_list if isinstance(locator_or_list, (list, tuple)) else [locator_or_list]
+        elements = []
+
+        for locator in locators:
+            elements.extend(self.find_elements(locator) if isinstance(locator, str) else [locator])
+
+        filenames = [self._screenshot_path(os.path.join(directory, str(index)), format)
+                     for index in range(len(elements))]
+        # IE captures the full page by its `full_page_screenshot` option, and runs the ES5 rects script.
+        full_page = hasattr(self.driver, 'execute_cdp_cmd') or self.browser in ('firefox', 'ie')
+        page = self.execute_script(f'''
+            {_RECTS_SCRIPT}
+            return {{ ratio: window.devicePixelRatio || 1, rects: rects(arguments[0], arguments[1]) }};
+        ''', elements, full_page)
+        screenshot = self._get_screenshot(full_page=full_page)
+        rects = [tuple(value * page['ratio'] for value in rect) for rect in page['rects']]
+
+        if self.screenshot_writer is None:
+            self.screenshot_writer = True
+
+        return self.screenshot_writer.submit(
+            screenshot, list(zip(rects, filenames)), partial(self._crop_screenshots, format=format, quality=quality))
+
+    @property
+    def screenshot_store(self):
+        """Content-addressed store of screenshots.
+
+        Set to True (under screen_root), a directory, a ScreenshotStore instance, or None (disabled).
+        The previous store is closed.
+
+        Returns:
+            ScreenshotStore: ScreenshotStore or None if disabled
+        """
+        return self.__screenshot_store
+
+    @screenshot_store.setter
+    def screenshot_store(self, store):
+        if store is True:
+            store = ScreenshotStore(self.screen_root)
+        elif isinstance(store, (str, bytes, os.PathLike)):
+            store = ScreenshotStore(store)
+        elif not isinstance(store, ScreenshotStore):
+            store = None
+
+        if self.__screenshot_store is not None and self.__screenshot_store is not store:
+            self.__screenshot_store.close()
+
+        self.__screenshot_store = store
+
+    @property
+    def screenshot_writer(self):
+        """Background writer of screenshots.
+
+        Set to True (2 writer threads), a ScreenshotWriter instance, or None (disabled).
+        The previous writer is closed after writing its pending screenshots.
+
+        Returns:
+            ScreenshotWriter: ScreenshotWriter or None if disabled
+        """
+        return self.__screenshot_writer
+
+    @screenshot_writer.setter
+    def screenshot_writer(self, writer):
+        if writer is True:
+            writer = ScreenshotWriter()
+        elif not isinstance(writer, ScreenshotWriter):
+            writer = None
+
+        if self.__screenshot_writer is not None and self.__screenshot_writer is not writer:
+            self.__screenshot_writer.close()
+
+        self.__screenshot_writer = writer
+
     @property
     def script_timeout(self):
         """Timeout for script.
@@ -1814,7 +2406,7 @@ class Spydr:
     @script_timeout.setter
     def script_timeout(self, seconds):
         self.__script_timeout = seconds
-        self.driver.set_script_timeout(seconds)
+        self.__timeouts.set(script=seconds)
 
     def scroll_into_view(self, locator, behavior="auto", block="start", inline="nearest"):
         """Scroll the element's parent to be displayed.
@@ -1839,7 +2431,7 @@ class Spydr:
         """
         self.find_element(locator).scroll_to(x, y)
 
-    def select_options(self, select_locator, filter_by='value', filter_value=None):
+    def select_options(self, select_locator, filter_by='value', filter_value=None, by=None):
         """Get options of an select element.  Filter the options by attribute if `filter_value` is given.
 
         Args:
@@ -1848,11 +2440,12 @@ class Spydr:
         Keyword Arguments:
             filter_by (str): Filter options by attribute. Defaults to 'value'.
             filter_value (str): Filter option's attribute by value. Defaults to None.
+            by (str): Get options' `value`, `text`, or `index` instead of options. Defaults to None.
 
         Returns:
-            list[WebElement]: All filtered options
+            list[WebElement]/list[int/str]: All filtered options, or their values when `by` is given
         """
-        return self.find_element(select_locator).select_options(filter_by='value', filter_value=None)
+        return self.find_element(select_locator).select_options(filter_by=filter_by, filter_value=filter_value, by=by)
 
     def select_to_be(self, select_locator, option_value, selected=True, option_by='value'):
         """Set `selected` state of the given `option` in the `select` drop-down menu.
@@ -1878,7 +2471,7 @@ class Spydr:
         """
         select = self.wait_until(lambda _: self._is_selectable(select_locator))
 
-        self._option_to_be(select, option_value, selected, option_by)
+        self._options_to_be(select, [option_value], selected, option_by)
 
     def select_to_be_all(self, select_locator):
         """Select all `option` in a **multiple** `select` drop-down menu.
@@ -1912,13 +2505,26 @@ class Spydr:
         """
         select = self.wait_until(lambda _: self._is_selectable(select_locator))
 
-        options = select.find_elements('css=option')
+        ignored_values = [str(option) for option in ignored_options if option is not None]
 
-        random_option = self._random_option(options, ignored_options=ignored_options)
+        # Pick the option by a random number from Python, so the selection follows `random.seed()`.
+        is_selected = self.execute_script(_CHANGE_EVENTS_SCRIPT + '''
+            let select = arguments[0];
+            let ignoredValues = arguments[1];
+            let options = Array.prototype.filter.call(select.options, function (option) {
+                return ignoredValues.indexOf(option.value) < 0;
+            });
 
-        if random_option:
-            random_option.click()
-        else:
+            if (options.length === 0) {
+                return false;
+            }
+
+            options[Math.floor(arguments[2] * options.length)].selected = true;
+            dispatchChange(select);
+            return true;
+        ''', select, ignored_values, random.random())
+
+        if not is_selected:
             raise WebDriverException(f'Cannot randomly select an option in: {select_locator}')
 
     def select_to_be_some(self, select_locator, option_values, selected=True, option_by='value'):
@@ -1937,16 +2543,13 @@ class Spydr:
             WebDriverException: Raise an error if select_locator is not `multiple`
             WebDriverException: Raise an error if option_values is not a `list`
         """
-        select = self.wait_until(lambda _: self._is_selectable(select_locator))
-
-        if not select.get_attribute('multiple'):
-            raise WebDriverException(f'select is not multiple: {select_locator}')
-
         if not isinstance(option_values, list):
             raise WebDriverException(f'option_values is not a list: {option_values}')
 
-        for option_value in option_values:
-            self._option_to_be(select, option_value, selected, option_by, multiple=True)
+        select = self.wait_until(lambda _: self._is_selectable(select_locator))
+
+        if not self._options_to_be(select, option_values, selected, option_by, multiple=True):
+            raise WebDriverException(f'select is not multiple: {select_locator}')
 
     def selected_options(self, select_locator, by='value'):
         """Get values of **selected** `option` in a `select` drop-down menu.
@@ -1956,6 +2559,8 @@ class Spydr:
 
         Keyword Arguments:
             by (str): Get selected options by `value`, `text`, or `index`. Defaults to 'value'.
+                `text` is the option's text with whitespace collapsed, not its rendered text,
+                so text hidden or transformed by CSS is returned as written in the page.
 
         Raises:
             InvalidSelectorException: Raise an error when element is not a select element
@@ -1964,31 +2569,27 @@ class Spydr:
         Returns:
             list[int/str]: list of values of all selected options
         """
-        select = self.find_element(select_locator)
-        options = []
+        if by not in _OPTION_BYS:
+            raise WebDriverException(f'Unsupported selected options by: {by}')
 
-        if select.tag_name != 'select':
-            raise InvalidSelectorException(f'Element is not a select: {select_locator}')
+        # `select.options` filtered by `selected`, instead of `selectedOptions`, which IE does not have.
+        values = self.execute_script(f'''
+            {_OPTIONS_SCRIPT}
+            let select = arguments[0];
 
-        if self.browser == 'ie':
-            multiple = select.get_attribute('multiple')
+            if (select.tagName !== 'SELECT') {{
+                return null;
+            }}
 
-            for option in select.find_elements('tag_name=option'):
-                if option.is_selected():
-                    options.append(option)
-                    if not multiple:
-                        break
-        else:
-            options.extend(select.selected_options())
+            return optionValues(Array.prototype.filter.call(select.options, function (option) {{
+                return option.selected;
+            }}), arguments[1]);
+        ''', self.find_element(select_locator), by)
 
-        if by == 'value':
-            return [opt.value for opt in options]
-        if by == 'text':
-            return [opt.text for opt in options]
-        if by == 'index':
-            return [opt.get_property('index') for opt in options]
+        if values is None:
+            raise InvalidSelectorException(f'Element is not a select: {select_locator}')
 
-        raise WebDriverException(f'Unsupported selected options by: {by}')
+        return values
 
     def send_keys(self, locator, *keys, blur=False, wait_until_enabled=False):
         """Simulate typing into the element.
@@ -2014,13 +2615,28 @@ class Spydr:
         self.find_element(locator).set_attribute(attribute, value)
 
     def set_download_dir(self, download_dir):
-        """Set Download directory (Chrome only)
+        """Set Download directory (Chrome only), and watch it for completed downloads as `self.downloads`.
 
         Args:
             download_dir (str): Download directory
+
+        Returns:
+            DownloadWatcher: Watcher of the download directory
+
+        Examples:
+            | downloads = s.set_download_dir('downloads')
+            | future = downloads.next_download()
+            | s.click('#export')
+            | path = future.result(timeout=30)
         """
-        self.execute_cdp_cmd('Browser.setDownloadBehavior',
-                             {'behavior': 'allow', 'downloadPath': self.abspath(download_dir, isdir=True)})
+        abs_dir = self.abspath(download_dir, isdir=True)
+        self.execute_cdp_cmd('Browser.setDownloadBehavior', {'behavior': 'allow', 'downloadPath': abs_dir})
+
+        if self.downloads is not None:
+            self.downloads.close()
+
+        self.downloads = DownloadWatcher(abs_dir)
+        return self.downloads
 
     def set_ini_key(self, key, value, section=None):
         """Set the value of the given key in INI.
@@ -2127,6 +2743,80 @@ class Spydr:
         """
         return self.find_element(locator).size
 
+    def snapshot(self, locator, fields):
+        """Collect the given fields of all elements, located by the locator, in one script call.
+
+        Supported fields:
+            - `attribute=name`: Attribute value, like `get_attribute()` without property fallback
+            - `class=name`: Whether the element has the CSS class, like `has_class()`
+            - `css=name`: CSS property value, like `css_property()`
+            - `property=name`: Property value, like `get_property()`
+            - `displayed`, `enabled`, `selected`: Element states
+            - `rect`: The size and location of the element
+            - `tag_name`, `text`, `text_content`, `value`: Element's tagName, visible text, textContent, and value
+
+        Args:
+            locator (str/list[WebElement]): The locator to identify the elements or list[WebElement]
+            fields (list[str]): Fields to collect
+
+        Raises:
+            WebDriverException: Raise an error when a field is not supported
+
+        Returns:
+            list[dict]: One record, keyed by field, per element
+
+        Examples:
+            | snapshot('.item', ['text', 'attribute=href', 'class=active', 'rect'])
+            | # [{'text': 'Home', 'attribute=href': '/home', 'class=active': True, 'rect': {'x': 0, 'y': 0, 'width': 80, 'height': 20}}]
+        """
+        fields = list(fields)
+        specs = [self._parse_snapshot_field(field) for field in fields]
+
+        records = self._execute_on_elements(locator, f'''
+            {_DISPLAYED_SCRIPT}
+            {_VISIBLE_TEXT_SCRIPT}
+            let value = function (element, kind, name) {{
+                switch (kind) {{
+                    case 'attribute':
+                        return element.getAttribute(name);
+                    case 'class':
+                        return element.classList.contains(name);
+                    case 'css':
+                        return window.getComputedStyle(element).getPropertyValue(name);
+                    case 'property':
+                        return element[name] === undefined ? null : element[name];
+                    case 'displayed':
+                        return isDisplayed(element);
+                    case 'enabled':
+                        return !element.disabled;
+                    case 'selected':
+                        return Boolean(element.selected || element.checked);
+                    case 'rect': {{
+                        let rect = element.getBoundingClientRect();
+                        return {{
+                            x: rect.left + window.pageXOffset, y: rect.top + window.pageYOffset,
+                            width: rect.width, height: rect.height
+                        }};
+                    }}
+                    case 'tag_name':
+                        return element.tagName.toLowerCase();
+                    case 'text':
+                        return visibleText(element).trim();
+                    case 'text_content':
+                        return element.textContent;
+                    case 'value':
+                        return element.value === undefined ? null : element.value;
+                }}
+            }};
+            return elements.map(function (element) {{
+                return args[0].map(function (spec) {{
+                    return value(element, spec[0], spec[1]);
+                }});
+            }});
+        ''', specs)
+
+        return [dict(zip(fields, values)) for values in records or []]
+
     def sleep(self, seconds):
         """Sleep the given seconds.
 
@@ -2243,6 +2933,40 @@ class Spydr:
         """
         return self.yml.t(key, **kwargs)
 
+    def table_headers(self, locator, text_content=False):
+        """Get the header texts of the table.
+
+        Args:
+            locator (str/WebElement): The locator to identify the table or WebElement
+
+        Keyword Arguments:
+            text_content (bool): Get `textContent` instead of the visible text. Defaults to False.
+
+        Returns:
+            list[str]: Header texts, one per column
+        """
+        return self.find_element(locator).table_headers(text_content=text_content)
+
+    def table_rows(self, locator, chunk_size=500, as_dict=False, text_content=False):
+        """Iterate the body rows of the table, reading `chunk_size` rows per script call.
+
+        Args:
+            locator (str/WebElement): The locator to identify the table or WebElement
+
+        Keyword Arguments:
+            chunk_size (int): Number of rows to read per script call. Defaults to 500.
+            as_dict (bool): Yield rows as dict keyed by `table_headers()`. Defaults to False.
+            text_content (bool): Get `textContent` instead of the visible text. Defaults to False.
+
+        Returns:
+            generator: Rows as list[str] (or dict when `as_dict`), with colspan/rowspan cells repeated
+
+        Examples:
+            | for row in table_rows('#report', as_dict=True):
+            |     print(row['Name'])
+        """
+        return self.find_element(locator).table_rows(chunk_size=chunk_size, as_dict=as_dict, text_content=text_content)
+
     def tag_name(self, locator):
         """Get the element's tagName.
 
@@ -2283,7 +3007,7 @@ class Spydr:
         """
         return self.find_element(locator).text_content.strip(None if strip else '')
 
-    def texts(self, locator, typecast=str):
+    def texts(self, locator, typecast=str, bulk=False, text_content=False):
         """Texts of all elements located by the locator.
 
         Args:
@@ -2291,10 +3015,18 @@ class Spydr:
 
         Keyword Arguments:
             typecast: Typecast the texts. Defaults to `str`.
+            bulk (bool): Locate the elements and get all texts in one script call. Defaults to False.
+            text_content (bool): Get `textContent` instead of the visible text. Defaults to False.
 
         Returns:
             list: list of texts, by `typecast`, of the given elements
         """
+        if bulk:
+            return [typecast(text) for text in self._texts(locator, text_content=text_content)]
+
+        if text_content:
+            return [typecast(element.text_content.strip()) for element in self.find_elements(locator)]
+
         return [typecast(element.text) for element in self.find_elements(locator)]
 
     def text_to_file(self, text, filename, suffix):
@@ -2348,9 +3080,10 @@ class Spydr:
     @timeout.setter
     def timeout(self, seconds):
         self.__timeout = seconds
-        self.implicitly_wait = seconds
-        self.page_load_timeout = seconds
-        self.script_timeout = seconds
+        self.__implicitly_wait = seconds
+        self.__page_load_timeout = seconds
+        self.__script_timeout = seconds
+        self.__timeouts.set(implicit=0, pageLoad=seconds, script=seconds)
 
     @staticmethod
     def timestamp(prefix='', suffix=''):
@@ -2408,6 +3141,29 @@ class Spydr:
         """
         self.find_element(locator).toggle_class(class_name)
 
+    @property
+    def tracer(self):
+        """Tracer of nested spans of Spydr methods, SpydrElement methods, waits, polls, and WebDriver commands.
+
+        Set to a file path, a Tracer instance, or None (disabled).
+
+        Returns:
+            Tracer: Tracer or None if disabled
+        """
+        return self.__tracer
+
+    @tracer.setter
+    def tracer(self, tracer):
+        if isinstance(tracer, (str, bytes, os.PathLike)):
+            tracer = Tracer(tracer)
+        elif not isinstance(tracer, Tracer):
+            tracer = None
+
+        self.__tracer = tracer
+        self._instrument_wait()
+        self._instrument_driver()
+        self._decorate_methods()
+
     def trigger(self, locator, event):
         """Trigger the given event on the element.
 
@@ -2459,7 +3215,7 @@ class Spydr:
         """
         return [typecast(element.value) for element in self.find_elements(locator)]
 
-    def wait_until(self, method, timeout=None, poll_frequency=0.5, ignored_exceptions=[NoSuchElementException]):
+    def wait_until(self, method, timeout=None, poll_frequency=None, ignored_exceptions=[NoSuchElementException], poll_strategy=None):
         """Create a WebDriverWait instance and wait until the given method is evaluated to not False.
 
         Args:
@@ -2467,26 +3223,86 @@ class Spydr:
 
         Keyword Arguments:
             timeout (int): Timeout. Defaults to `self.timeout`.
-            poll_frequency (float): Sleep interval between method calls. Defaults to 0.5.
+            poll_frequency (float): Fixed sleep interval between method calls. Defaults to None (`self.poll_strategy`).
             ignored_exceptions (list[Exception]): Exception classes to ignore during calls. Defaults to (NoSuchElementException).
+            poll_strategy (str/PollStrategy): 'fixed', 'backoff', 'learned', or PollStrategy. Defaults to `self.poll_strategy`.
+                'learned' reuses the latencies learned by `self.poll_strategy` or by earlier 'learned' calls.
 
         Returns:
             Any applicable return from the method call
 
         Examples:
             | wait_until(lambda wd: method(wd), timeout=5)
+            | wait_until(lambda wd: method(wd), poll_strategy='backoff')
         """
         timeout = int(timeout) if timeout is not None else self.timeout
-        return self.wait(self.driver, timeout, poll_frequency, ignored_exceptions).until(method)
 
-    def wait_until_alert_present(self):
-        """Wait until alert is present.
+        if poll_strategy == 'learned':
+            if isinstance(self.poll_strategy, LearnedPoll):
+                poll_strategy = self.poll_strategy
+            else:
+                self.__learned_poll = self.__learned_poll or LearnedPoll()
+                poll_strategy = self.__learned_poll
 
-        Returns:
-            False/Alert: Return False if not present. Return Alert if present.
-        """
+        return self.wait(self.driver, timeout, poll_frequency, ignored_exceptions, strategy=poll_strategy).until(method)
 
-        return self.wait_until(lambda _: self._alert_is_present())
+    def wait_until_ajax_idle(self, idle_ms=500, max_pending=0, timeout=None):
+        """Wait until no more than `max_pending` fetch, XMLHttpRequest, or jQuery ajax calls are pending for `idle_ms` milliseconds.
+
+        Pending calls are counted by a tracker installed in the page by the first wait, so the application's
+        `XMLHttpRequest` and `fetch` are only wrapped when ajax waits are used.  Calls started before the tracker
+        is installed are not counted.  On Chromium, the first wait also installs it in every new document of the window
+        before its scripts run, so calls started by an action (like `click()`) on later pages are counted.
+        The wait is resolved in the page by a single async script.
+
+        Keyword Arguments:
+            idle_ms (int): Milliseconds the page must stay idle. Defaults to 500.
+            max_pending (int): Number of pending calls still considered idle, like long polling. Defaults to 0.
+            timeout (int): Timeout. Defaults to `self.timeout`.
+
+        Raises:
+            TimeoutException: Raise an error when the page is not idle before timeout
+
+        Returns:
+            bool: Whether the page is idle
+        """
+        timeout = int(timeout) if timeout is not None else self.timeout
+
+        if hasattr(self.driver, 'execute_cdp_cmd'):
+            self._track_ajax_in_new_documents()
+
+        # jQuery ajax calls are also XMLHttpRequests, but `jQuery.active` counts JSONP calls too.
+        result = self._execute_async_until(_AJAX_TRACKER_SCRIPT + '''
+            let idleMs = arguments[0], maxPending = arguments[1], timeout = arguments[2];
+            let callback = arguments[arguments.length - 1];
+            let ajax = window.__spydrAjax;
+            let endTime = Date.now() + timeout;
+            let check = function () {
+                let pending = Math.max(ajax.pending, window.jQuery && window.jQuery.active || 0);
+                if (pending <= maxPending && Date.now() - ajax.last >= idleMs) {
+                    callback(true);
+                } else if (Date.now() >= endTime) {
+                    callback(null);
+                } else {
+                    setTimeout(check, 50);
+                }
+            };
+            check();
+        ''', timeout, idle_ms, max_pending)
+
+        if result is None:
+            raise TimeoutException(f'Ajax calls not idle in {timeout} seconds.')
+
+        return result
+
+    def wait_until_alert_present(self):
+        """Wait until alert is present.
+
+        Returns:
+            False/Alert: Return False if not present. Return Alert if present.
+        """
+
+        return self.wait_until(lambda _: self._alert_is_present())
 
     def wait_until_attribute_contains(self, locator, attribute, value):
         """Wait until the element's attribute contains the given value.
@@ -2500,7 +3316,18 @@ class Spydr:
             bool: Whether value is found in the element's attribute
         """
         try_fn = self._try_and_catch(lambda: self.has_attribute_value(locator, attribute, value))
-        return self.wait_until(lambda _: try_fn())
+        return self._wait_until_observed(lambda _: try_fn(), locator, '''
+            if (elements.length === 0) {
+                return false;
+            }
+            let value = elements[0][args[0]];
+            if (typeof value === 'boolean') {
+                value = value ? 'true' : null;
+            } else if (value === undefined || value === null || typeof value === 'object' || typeof value === 'function') {
+                value = elements[0].getAttribute(args[0]);
+            }
+            return value !== null && String(value).indexOf(args[1]) > -1;
+        ''', attribute, str(value))
 
     def wait_until_class_contains(self, locator, class_name):
         """Wait until the element contains the given CSS class.
@@ -2512,7 +3339,9 @@ class Spydr:
         Returns:
             bool: Whether the element contains the given CSS class
         """
-        return self.wait_until(lambda _: self.has_class(locator, class_name))
+        return self._wait_until_observed(
+            lambda _: self.has_class(locator, class_name), locator,
+            'return elements.length > 0 && elements[0].classList.contains(args[0]);', class_name)
 
     def wait_until_class_excludes(self, locator, class_name):
         """Wait until the element excludes the given CSS class.
@@ -2524,7 +3353,9 @@ class Spydr:
         Returns:
             bool: Whether the element excludes the given CSS class
         """
-        return self.wait_until(lambda _: not self.has_class(locator, class_name))
+        return self._wait_until_observed(
+            lambda _: not self.has_class(locator, class_name), locator,
+            'return elements.length > 0 && !elements[0].classList.contains(args[0]);', class_name)
 
     def wait_until_displayed(self, locator):
         """Wait until the element is displayed.
@@ -2535,7 +3366,8 @@ class Spydr:
         Returns:
             bool: Whether the element is displayed
         """
-        return self.wait_until(lambda _: self.is_displayed(locator))
+        return self._wait_until_observed(
+            lambda _: self.is_displayed(locator), locator, 'return elements.length > 0 && isDisplayed(elements[0]);')
 
     def wait_until_displayed_and_get_element(self, locator):
         """Wait until the element is displayed and return the element.
@@ -2558,7 +3390,8 @@ class Spydr:
         Returns:
             bool: Whether the element is enabled
         """
-        return self.wait_until(lambda _: self.is_enabled(locator))
+        return self._wait_until_observed(
+            lambda _: self.is_enabled(locator), locator, "return elements.length > 0 && !elements[0].matches(':disabled');")
 
     def wait_until_frame_available_and_switch(self, frame_locator):
         """Wait until the given frame is available and switch to it.
@@ -2590,15 +3423,18 @@ class Spydr:
         finally:
             self.timeout = _timeout
 
-    def wait_until_listdir_equal_to(self, directory, number, sleep=2):
-        """Wait until the directory has the given number of files.
+    def wait_until_listdir_equal_to(self, directory, number, sleep=None):
+        """Wait until the directory has the given number of completed files.
+
+        Partially downloaded files, like `.crdownload` and `.part`, are not counted.
+        When `directory` is the download directory (`set_download_dir()`), it waits on filesystem events.
 
         Args:
             directory (str): Directory
-            number (int): Number of files in the directory
+            number (int): Number of completed files in the directory
 
         Keyword Arguments:
-            sleep (int): Seconds to sleep after number of files matched. Defaults to 2.
+            sleep (int): Seconds to sleep after number of files matched. Defaults to None.
 
         Raises:
             WebDriverException: Raise an error when `directory` is not a directory or when number of files not matched.
@@ -2612,14 +3448,17 @@ class Spydr:
             raise WebDriverException(f'Not a directory: {directory}')
 
         try:
-            self.wait_until(lambda _: len(os.listdir(abs_dir)) == number)
+            if self.downloads is not None and self.downloads.directory == os.path.abspath(abs_dir):
+                self.downloads.wait_until_number_of_files(number, self.timeout)
+            else:
+                self.wait_until(lambda _: len(completed_files(abs_dir)) == number)
             if isinstance(sleep, int):
                 self.sleep(sleep)
             return True
         except TimeoutException:
-            raise WebDriverException(f'Number of files ({len(os.listdir(abs_dir))}) not equal to {number}.')
+            raise WebDriverException(f'Number of files ({len(completed_files(abs_dir))}) not equal to {number}.')
 
-    def wait_until_loading_finished(self, locator, seconds=2, loading_wait=None, sleep=None):
+    def wait_until_loading_finished(self, locator, seconds=2, loading_wait=None, sleep=None, ajax_idle=False):
         """Wait the given `seconds` until loading/spinning element, by `locator`, shows up.
         If/when shown, wait until not displayed. If not, this is equivalent to sleep the given `seconds`.
 
@@ -2631,34 +3470,36 @@ class Spydr:
             loading_wait (int): Seconds to wait for the loading-like element to disappear.
                                 When None, it is default to `implicit_wait`.  Defaults to None.
             sleep (int): Seconds to sleep after loading finished. Defaults to None.
+            ajax_idle (bool): Wait until ajax calls are idle (`wait_until_ajax_idle()`) after loading finished,
+                              instead of sleeping a fixed time. Defaults to False.
 
         Returns:
             bool: Whether the element is not displayed
         """
         how, what = self._parse_locator(locator)
-        implicitly_wait = self.implicitly_wait
-        self.implicitly_wait = seconds
 
         if loading_wait is None or not isinstance(loading_wait, int):
-            loading_wait = implicitly_wait
+            loading_wait = self.implicitly_wait
 
         try:
             self.wait(self.driver, seconds).until(lambda wd: wd.find_element(how, what).is_displayed())
-            self.implicitly_wait = 0
             try:
-                return self.wait(self.driver, loading_wait).until_not(lambda wd: wd.find_element(how, what).is_displayed())
+                finished = self.wait(self.driver, loading_wait).until_not(lambda wd: wd.find_element(how, what).is_displayed())
             except (NoSuchElementException, StaleElementReferenceException):
-                return True
+                finished = True
             except TimeoutException:
                 raise WebDriverException('Loading element not disappeared before timeout.')
         except (NoSuchElementException, StaleElementReferenceException, TimeoutException):
-            return True
+            finished = True
         finally:
-            self.implicitly_wait = implicitly_wait
-
             if sleep is not None:
                 self.sleep(sleep)
 
+        if ajax_idle:
+            self.wait_until_ajax_idle()
+
+        return finished
+
     def wait_until_located(self, locator):
         """Wait until the element is located.
 
@@ -2668,7 +3509,37 @@ class Spydr:
         Returns:
             bool: Whether the element is located
         """
-        return self.wait_until(lambda _: self.is_located(locator))
+        return self._wait_until_observed(
+            lambda _: self.is_located(locator), locator, 'return elements.length > 0 ? elements[0] : false;')
+
+    def wait_until_network_idle(self, idle_ms=500, max_inflight=0, timeout=None):
+        """Wait until no more than `max_inflight` network requests are in flight for `idle_ms` milliseconds.
+
+        Requests are tracked from Chrome DevTools Network events, recorded by Chrome with `network_events=True`,
+        and requests of the previous document are dropped when the page navigates to a new one.
+        Otherwise, it waits until ajax calls are idle by `wait_until_ajax_idle()`.
+
+        Keyword Arguments:
+            idle_ms (int): Milliseconds the network must stay idle. Defaults to 500.
+            max_inflight (int): Number of in-flight requests still considered idle, like long polling. Defaults to 0.
+            timeout (int): Timeout. Defaults to `self.timeout`.
+
+        Raises:
+            TimeoutException: Raise an error when the network is not idle before timeout
+
+        Returns:
+            bool: Whether the network is idle
+
+        Examples:
+            | s = Spydr(network_events=True)
+            | s.click('#search')
+            | s.wait_until_network_idle(idle_ms=300)
+        """
+        if not self.network_events or self.browser != 'chrome':
+            return self.wait_until_ajax_idle(idle_ms, max_inflight, timeout)
+
+        return self.wait_until(lambda _: self._is_network_idle(idle_ms, max_inflight),
+                               timeout=timeout, poll_frequency=min(idle_ms / 4000, 0.5) or 0.05)
 
     def wait_until_not(self, method):
         """Create a WebDriverWait instance and wait until the given method is evaluated to False.
@@ -2694,15 +3565,11 @@ class Spydr:
             bool: Whether the element is not displayed
         """
         how, what = self._parse_locator(locator)
-        implicitly_wait = self.implicitly_wait
-        self.implicitly_wait = seconds
 
         try:
             return self.wait(self.driver, seconds).until(lambda wd: not wd.find_element(how, what))
         except (NoSuchElementException, StaleElementReferenceException, TimeoutException):
             return True
-        finally:
-            self.implicitly_wait = implicitly_wait
 
     def wait_until_number_of_windows_to_be(self, number):
         """Wait until number of windows matches the given number.
@@ -2720,24 +3587,22 @@ class Spydr:
         self.wait_until(lambda _: self.is_page_loaded())
 
     def wait_until_page_not_changed(self, seconds=10, interval=2):
-        """Wait until page_source not changed (page_source are compared at the interval)
+        """Wait until the page not changed for the `interval` (quiet period).
+
+        Changes are counted in the page by MutationObserver, so only the count is compared at the interval.
+        Navigating to another page counts as a change.
 
         Keyword Arguments:
             seconds (int): Seconds to give up waiting. Defaults to 10.
-            interval (int): Interval to compare page_source. Defaults to 2.
+            interval (int): Quiet period to compare the page. Defaults to 2.
 
         Returns:
-            bool: Whether page_source not changed
+            bool: Whether the page not changed (also True when giving up)
         """
-        implicitly_wait = self.implicitly_wait
-        self.implicitly_wait = seconds
-
         try:
-            self.wait(self.driver, seconds).until(lambda _: not self._is_page_changed_at_interval(interval=interval))
+            return self.wait(self.driver, seconds).until(lambda _: not self._is_page_changed_at_interval(interval=interval))
         except TimeoutException:
             return True
-        finally:
-            self.implicitly_wait = implicitly_wait
 
     def wait_until_selected(self, locator):
         """Wait until the element is selected.
@@ -2748,7 +3613,9 @@ class Spydr:
         Returns:
             bool: Whether the element is selected
         """
-        return self.wait_until(lambda _: self.is_selected(locator))
+        return self._wait_until_observed(
+            lambda _: self.is_selected(locator), locator,
+            'return elements.length > 0 && !!(elements[0].checked || elements[0].selected);')
 
     def wait_until_selection_to_be(self, locator, is_selected):
         """Wait until the element's `selected` state to match the given state.
@@ -2760,7 +3627,9 @@ class Spydr:
         Returns:
             bool: Whether the element's `selected` state matching the given state
         """
-        return self.wait_until(lambda _: self.is_selected(locator) == is_selected)
+        return self._wait_until_observed(
+            lambda _: self.is_selected(locator) == is_selected, locator,
+            'return elements.length > 0 && !!(elements[0].checked || elements[0].selected) === args[0];', bool(is_selected))
 
     def wait_until_text_contains(self, locator, text):
         """Wait until the element's text contains the given text.
@@ -2773,7 +3642,9 @@ class Spydr:
             bool: Whether the element's text containing the given text
         """
         try_fn = self._try_and_catch(lambda: self.has_text(locator, text))
-        return self.wait_until(lambda _: try_fn())
+        return self._wait_until_observed(
+            lambda _: try_fn(), locator,
+            'return elements.length > 0 && visibleText(elements[0]).trim().indexOf(args[0]) > -1;', text)
 
     def wait_until_text_equal_to(self, locator, text):
         """Wait until the element's text equal to the given text.
@@ -2786,7 +3657,8 @@ class Spydr:
             bool: Whether the element's text equal to the given text
         """
         try_fn = self._try_and_catch(lambda: self.is_text_matched(locator, text))
-        return self.wait_until(lambda _: try_fn())
+        return self._wait_until_observed(
+            lambda _: try_fn(), locator, 'return elements.length > 0 && visibleText(elements[0]).trim() === args[0];', text)
 
     def wait_until_text_excludes(self, locator, text):
         """Wait until the element's text to exclude the given text.
@@ -2799,7 +3671,9 @@ class Spydr:
             bool: Whether the element's text excluding the given text
         """
         try_fn = self._try_and_catch(lambda: not self.has_text(locator, text))
-        return self.wait_until(lambda _: try_fn())
+        return self._wait_until_observed(
+            lambda _: try_fn(), locator,
+            'return elements.length > 0 && visibleText(elements[0]).trim().indexOf(args[0]) === -1;', text)
 
     def wait_until_text_not_equal_to(self, locator, text):
         """Wait until the element's text not equal to the given text.
@@ -2812,7 +3686,8 @@ class Spydr:
             bool: Whether the element's text not equal to the given text
         """
         try_fn = self._try_and_catch(lambda: not self.is_text_matched(locator, text))
-        return self.wait_until(lambda _: try_fn())
+        return self._wait_until_observed(
+            lambda _: try_fn(), locator, 'return elements.length > 0 && visibleText(elements[0]).trim() !== args[0];', text)
 
     def wait_until_title_contains(self, title):
         """Wait until the title of the current page contains the given title.
@@ -2823,7 +3698,8 @@ class Spydr:
         Returns:
             bool: Whether the title containing the given title
         """
-        return self.wait_until(expected_conditions.title_contains(title))
+        return self._wait_until_observed(
+            expected_conditions.title_contains(title), None, 'return document.title.indexOf(args[0]) > -1;', title)
 
     def wait_until_url_contains(self, url, timeout=None):
         """Wait until the URL of the current window contains the given URL.
@@ -2882,6 +3758,9 @@ class Spydr:
         else:
             self.__yml = YML(file)
 
+        # `yml=` locators are resolved by the previous YML instance
+        self.locator_cache.clear()
+
     def zoom(self, scale):
         """Set the zoom factor of a document defined by the viewport.
 
@@ -2948,6 +3827,48 @@ class Spydr:
 
         return filename
 
+    def _checkboxes_to_be(self, locator, is_checked, on_values):
+        result = self._execute_on_elements(locator, '''
+            let isChecked = args[0];
+            let onValues = args[1];
+
+            for (let i = 0; i < elements.length; i++) {
+                if (elements[i].tagName !== 'INPUT' || elements[i].type !== 'checkbox') {
+                    return {invalid: i, failed: []};
+                }
+            }
+
+            let targets = elements.map(function (element) {
+                return onValues && onValues.indexOf(element.value.trim()) < 0 ? !isChecked : isChecked;
+            });
+
+            elements.forEach(function (element, i) {
+                if (element.checked !== targets[i] && !element.disabled) {
+                    element.click();
+                }
+            });
+
+            let failed = [];
+
+            elements.forEach(function (element, i) {
+                if (element.checked !== targets[i] && !element.disabled) {
+                    failed.push([i, element.value]);
+                }
+            });
+
+            return {invalid: null, failed: failed};
+        ''', bool(is_checked), on_values or None)
+
+        if not result:
+            return
+
+        if result['invalid'] is not None:
+            raise InvalidSelectorException(f'Element is not a checkbox: {locator} (index: {result["invalid"]})')
+
+        if result['failed']:
+            failed = ', '.join(f'{index}={value}' for index, value in result['failed'])
+            raise WebDriverException(f'Failed to click on the checkboxes ({failed}): {locator}')
+
     def _chrome_options(self):
         # https://chromium.googlesource.com/chromium/src/+/master/chrome/common/chrome_switches.cc
         # https://chromium.googlesource.com/chromium/src/+/master/chrome/common/pref_names.cc
@@ -2985,6 +3906,10 @@ class Spydr:
             }
         })
 
+        if self.network_events:
+            # ChromeDriver enables the Network domain for performance logs
+            options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+
         if self.headless:
             options.add_argument('headless')
             options.add_argument(f'window-size={self.window_size}')
@@ -2995,20 +3920,138 @@ class Spydr:
 
         return options
 
+    def _crop_screenshots(self, screenshot, crops, format='png', quality=None):
+        rects, filenames = zip(*crops) if crops else ((), ())
+        images = crop_screenshots(screenshot, rects, format, quality)
+        return [filename if image is not None and self._write_screenshot(image, filename) else None
+                for image, filename in zip(images, filenames)]
+
+    def _decorate_methods(self):
+        # Only DEBUG instances or instances with metrics/tracer have their public methods decorated, as instance attributes.
+        # Otherwise, methods are looked up from the class without any overhead.
+        names = _decorated_method_names(type(self))
+
+        for fn_name in names:
+            self.__dict__.pop(fn_name, None)
+
+        if logging.DEBUG >= self.log_level or self.metrics is not None or self.tracer is not None:
+            for fn_name in names:
+                setattr(self, fn_name, self._decorator(getattr(self, fn_name)))
+
     def _decorator(self, fn):
+        debug = logging.DEBUG >= self.log_level
+        metrics = self.metrics
+        traced = self.tracer.trace('spydr', fn) if self.tracer is not None else fn
+
         @wraps(fn)
         def wrapper(*args, **kwargs):
-            # namespace = inspect.currentframe().f_back.f_locals
-            namespace = inspect.stack()[0].frame.f_back.f_locals
-            if 'self' not in namespace or not isinstance(namespace['self'], self.__class__):
-                p1_args = ', '.join(f'{str(x).strip()}' for x in args)
-                p2_args = ', '.join([f'{k}={str(v).strip()}' for k, v in kwargs.items()])
-                fn_name = fn.__name__
-                fn_arguments = ", ".join(x for x in [p1_args, p2_args] if x)
-                self.debug(f'{fn_name}({fn_arguments})')
-            return fn(*args, **kwargs)
+            # Only log calls made outside of Spydr
+            if debug:
+                caller = sys._getframe(1).f_locals.get('self')
+                if not isinstance(caller, self.__class__):
+                    p1_args = ', '.join(f'{str(x).strip()}' for x in args)
+                    p2_args = ', '.join([f'{k}={str(v).strip()}' for k, v in kwargs.items()])
+                    fn_name = fn.__name__
+                    fn_arguments = ", ".join(x for x in [p1_args, p2_args] if x)
+                    self.debug(f'{fn_name}({fn_arguments})')
+
+            if metrics is None:
+                return traced(*args, **kwargs)
+
+            start = perf_counter()
+            try:
+                return traced(*args, **kwargs)
+            finally:
+                metrics.observe('spydr', fn.__name__, perf_counter() - start)
         return wrapper
 
+    def _find_element(self, locator, seconds=None):
+        if isinstance(locator, WebElement):
+            return locator
+
+        _, _, eq = self._parse_cached_locator(locator)
+
+        if eq:
+            return self._find_eq_element(locator, eq, seconds=seconds)
+
+        element = self.is_located(locator, seconds)
+
+        if not isinstance(element, WebElement):
+            raise NoSuchElementException(f'Cannot locate element in the given time using: {locator}')
+
+        return element
+
+    def _find_eq_element(self, locator, eq, element=None, seconds=None):
+        selector, index = eq
+        seconds = seconds if seconds is not None else self.implicitly_wait
+        # `false` keeps waiting for matching elements; `[null]` stops waiting for an out-of-range index.
+        script = '''
+            let elements = (arguments[0] || document).querySelectorAll(arguments[1]);
+            let index = arguments[2] < 0 ? elements.length + arguments[2] : arguments[2];
+            return elements.length > 0 ? [elements[index] || null] : false;
+        '''
+        found = self.driver.execute_script(script, element, selector, index)
+
+        if not found and seconds:
+            try:
+                found = self.wait(self.driver, seconds).until(
+                    lambda wd: wd.execute_script(script, element, selector, index))
+            except TimeoutException:
+                pass
+
+        if not found or not isinstance(found[0], WebElement):
+            raise NoSuchElementException(f'{locator} does not have ":eq({index})" element')
+
+        return found[0]
+
+    def _execute_async_until(self, script, timeout, *args):
+        # Async scripts are limited by `script_timeout`, so run the script in chunks of it until it calls back
+        # with a non-null result. The chunk (in milliseconds) is passed as the last argument before the callback.
+        end_time = perf_counter() + timeout
+
+        while True:
+            remaining = end_time - perf_counter()
+
+            if remaining <= 0:
+                return None
+
+            chunk = min(remaining, self.script_timeout) if self.script_timeout else remaining
+
+            try:
+                result = self.driver.execute_async_script(script, *args, int(chunk * 1000))
+            except TimeoutException:
+                continue
+
+            if result is not None:
+                return result
+
+    def _execute_on_elements(self, locator, script, *args, root=None):
+        if isinstance(locator, (list, tuple)) and all(isinstance(el, WebElement) for el in locator):
+            how, what = None, list(locator)
+        else:
+            how, what = root._parse_locator(locator) if root is not None else self._parse_locator(locator)
+
+        # Return null to keep waiting for the elements. Otherwise, wrap the result in an array to stop waiting.
+        script = f'''
+            {_ELEMENTS_SCRIPT}
+            if (elements.length === 0) {{
+                return null;
+            }}
+            return [(function (elements, args) {{
+                {script}
+            }})(elements, args)];
+        '''
+        result = self.driver.execute_script(script, how, what, root, *args)
+
+        if result is None and how is not None and self.implicitly_wait:
+            try:
+                result = self.wait(self.driver, self.implicitly_wait).until(
+                    lambda wd: wd.execute_script(script, how, what, root, *args))
+            except TimeoutException:
+                pass
+
+        return result[0] if result else None
+
     def _firefox_options(self):
         profile = webdriver.FirefoxProfile()
         profile.accept_untrusted_certs = True
@@ -3072,6 +4115,43 @@ class Spydr:
         if self.browser == 'safari':
             return webdriver.Safari()
 
+    def _get_screenshot(self, format='png', quality=None, clip=None, scale=None, full_page=False):
+        options = format != 'png' or quality is not None or clip is not None or scale is not None
+
+        if hasattr(self.driver, 'execute_cdp_cmd') and (options or full_page):
+            params = {'format': format}
+
+            if quality is not None:
+                params['quality'] = quality
+
+            if clip is None and (full_page or scale is not None):
+                layout = self.execute_cdp_cmd('Page.getLayoutMetrics')
+
+                if full_page:
+                    # Clip to the content size, so the page is rendered beyond the viewport without scrolling.
+                    size = layout.get('cssContentSize') or layout['contentSize']
+                    clip = (0, 0, size['width'], size['height'])
+                else:
+                    viewport = layout.get('cssLayoutViewport') or layout['layoutViewport']
+                    clip = (viewport['pageX'], viewport['pageY'], viewport['clientWidth'], viewport['clientHeight'])
+
+            if clip is not None:
+                params['clip'] = dict(self._to_clip(clip), scale=scale or 1)
+                params['captureBeyondViewport'] = True
+
+            return self.execute_cdp_cmd('Page.captureScreenshot', params)['data']
+
+        if options:
+            raise WebDriverException(
+                f'Screenshot format, quality, clip, and scale are only supported on Chromium: {self.browser}')
+
+        if full_page and self.browser == 'firefox':
+            self.driver.command_executor._commands.setdefault(
+                'FULL_PAGE_SCREENSHOT', ('GET', '/session/$sessionId/moz/screenshot/full'))
+            return self.driver.execute('FULL_PAGE_SCREENSHOT')['value']
+
+        return self.driver.get_screenshot_as_base64()
+
     def _get_whitelist(self, urls, sep=r',?\s+', wildcard=False):
         url_list = []
 
@@ -3091,11 +4171,52 @@ class Spydr:
         options.native_events = False
         return options
 
+    def _instrument_driver(self):
+        # Time and trace WebDriver commands by wrapping `driver.execute` as an instance attribute.
+        driver = getattr(self, 'driver', None)
+
+        if driver is None:
+            return
+
+        driver.__dict__.pop('execute', None)
+
+        if self.metrics is not None or self.tracer is not None:
+            execute = driver.execute
+            metrics = self.metrics
+            tracer = self.tracer
+
+            @wraps(execute)
+            def wrapper(driver_command, params=None):
+                start = perf_counter()
+                try:
+                    if tracer is None:
+                        return execute(driver_command, params)
+
+                    with tracer.span(driver_command, 'command',
+                                     lambda: tracer.format_args((), params or {}, driver_command, 'command')):
+                        return execute(driver_command, params)
+                finally:
+                    if metrics is not None:
+                        metrics.observe('command', driver_command, perf_counter() - start)
+
+            driver.execute = wrapper
+
+    def _instrument_wait(self):
+        # Apply `poll_strategy` and `tracer` to `self.wait` as an instance attribute.
+        self.__dict__.pop('wait', None)
+        wait = self.wait
+
+        if self.poll_strategy is not None:
+            wait = type(wait.__name__, (wait,), {'strategy': self.poll_strategy})
+
+        if self.tracer is not None:
+            wait = self.tracer.trace_wait(wait)
+
+        if wait is not self.wait:
+            self.wait = wait
+
     def _is_checkbox_or_radio_clicked(self, element):
         is_selected = element.is_selected()
-        implicitly_wait = self.implicitly_wait
-
-        self.implicitly_wait = 0
 
         try:
             element.click()
@@ -3104,8 +4225,6 @@ class Spydr:
                 element.send_keys(self.keys.SPACE, blur=True)
             except:
                 element.js_click()
-        finally:
-            self.implicitly_wait = implicitly_wait
 
         return True if element.is_selected() is not is_selected else False
 
@@ -3128,95 +4247,275 @@ class Spydr:
         except NoSuchFrameException:
             return False
 
+    def _is_network_idle(self, idle_ms, max_inflight):
+        # Track in-flight requests by requestId. Performance logs are cleared once read.
+        # Activity is timed locally when read, as log timestamps are from the clock of the driver's host.
+        for entry in self.driver.get_log('performance'):
+            message = json.loads(entry['message'])['message']
+            method = message.get('method')
+            params = message.get('params', {})
+
+            if method == 'Network.requestWillBeSent':
+                if params.get('request', {}).get('url', '').startswith('data:'):
+                    continue
+                self.__network_requests[params['requestId']] = params['request']['url']
+            elif method in ('Network.loadingFinished', 'Network.loadingFailed'):
+                if self.__network_requests.pop(params.get('requestId'), None) is None:
+                    continue
+            elif method == 'Page.frameNavigated' and not params.get('frame', {}).get('parentId'):
+                # Requests of the previous document may never finish.
+                self.__network_requests.clear()
+            else:
+                continue
+
+            self.__network_activity = perf_counter()
+
+        return (len(self.__network_requests) <= max_inflight
+                and perf_counter() - self.__network_activity >= idle_ms / 1000)
+
     def _is_page_changed_at_interval(self, interval=1):
-        before_page = self.page_source
+        before_page = self._page_mutations()
         self.sleep(interval)
-        after_page = self.page_source
+        after_page = self._page_mutations()
         return before_page != after_page
 
-    def _is_page_changed_after_refresh(self, body_text_diff=True):
-        before_page = self.find_element('//body').text_content if body_text_diff else self.page_source
+    def _is_page_changed_after_refresh(self, body_text_diff=True, regions=None):
+        before_page = self._page_digests(body_text_diff, regions)
         self.refresh()
         self.wait_until_page_loaded()
-        after_page = self.find_element('//body').text_content if body_text_diff else self.page_source
-        return before_page != after_page
+        after_page = self._page_digests(body_text_diff, regions)
 
-    def _is_selectable(self, locator):
-        select = self.find_element(locator)
+        if regions is None:
+            return before_page != after_page
 
-        if select.tag_name != 'select':
-            raise WebDriverException(f'Locator is not a select element: {locator}')
+        return [region for region, before, after in zip(regions, before_page, after_page) if before != after]
 
-        if not select.is_enabled():
-            return False
+    def _is_selectable(self, locator):
+        select = self.find_element(locator)
 
         try:
-            options = select.find_elements('css=option')
-            return select if len(options) > 0 else False
+            selectable = self.execute_script('''
+                let select = arguments[0];
+                return select.tagName === 'SELECT' ? !select.disabled && select.options.length > 0 : null;
+            ''', select)
         except (NoSuchWindowException, StaleElementReferenceException):
             return False
 
+        if selectable is None:
+            raise WebDriverException(f'Locator is not a select element: {locator}')
+
+        return select if selectable else False
+
     def _multiple_select_to_be(self, element, state):
         if not isinstance(element, WebElement):
             raise WebDriverException(f'Not WebElement: {element}')
 
-        if element.tag_name != 'select':
-            raise WebDriverException(f'Element is not a select: {element}')
+        error = self.execute_script(_CHANGE_EVENTS_SCRIPT + '''
+            let select = arguments[0];
+            let state = arguments[1];
+            let isChanged = false;
 
-        if element.get_attribute('multiple'):
-            for option in element.find_elements('css=option'):
-                if option.is_selected() != state:
-                    option.click()
-        else:
+            if (select.tagName !== 'SELECT') {
+                return 'select';
+            }
+
+            if (!select.multiple) {
+                return 'multiple';
+            }
+
+            Array.prototype.forEach.call(select.options, function (option) {
+                if (option.selected !== state) {
+                    option.selected = state;
+                    isChanged = true;
+                }
+            });
+
+            if (isChanged) {
+                dispatchChange(select);
+            }
+
+            return null;
+        ''', element, bool(state))
+
+        if error == 'select':
+            raise WebDriverException(f'Element is not a select: {element}')
+        if error == 'multiple':
             raise WebDriverException(f'Element is not a multiple select: {element}')
 
-    def _option_to_be(self, select, option_value, selected, option_by, multiple=False):
-        option = None
-
-        if option_by == 'value':
-            option = select.find_element(f'[value="{option_value}"]')
-        elif option_by == 'text':
-            option = select.find_element(f'//*[text()="{option_value}"]')
-        elif option_by == 'index':
-            options = select.find_elements('tag_name=option')
-            index = int(option_value)
-            option = options[index] if index < len(options) else None
-        else:
-            option = select.find_element(f'[{option_by}="{option_value}"]')
+    def _options_to_be(self, select, option_values, selected, option_by, multiple=False):
+        # Match and set all options in one script call. Return False if `multiple` is required but select is not.
+        # Options of a single select can only be selected, the same as clicking on them.
+        # Negative indexes count from the last option.
+        option_values = [int(value) if option_by == 'index' else str(value) for value in option_values]
+
+        missing = self.execute_script(_CHANGE_EVENTS_SCRIPT + '''
+            let select = arguments[0];
+            let optionValues = arguments[1];
+            let selected = arguments[2];
+            let optionBy = arguments[3];
+            let isChanged = false;
+
+            if (arguments[4] && !select.multiple) {
+                return null;
+            }
 
-        if not option:
-            raise WebDriverException(f'Cannot using "{option_by}" to identify the option: {option_value}')
+            let isMatched = function (option, value) {
+                switch (optionBy) {
+                    case 'value':
+                        return option.getAttribute('value') === value;
+                    case 'text':
+                        return Array.prototype.some.call(option.childNodes, function (node) {
+                            return node.nodeType === Node.TEXT_NODE && node.nodeValue === value;
+                        });
+                    case 'index':
+                        return option.index === (value < 0 ? select.options.length + value : value);
+                    default:
+                        return option.getAttribute(optionBy) === value;
+                }
+            };
 
-        if option.is_selected() != selected:
-            if multiple:
-                option.click()
-            else:
-                self.click(option)
+            let missing = optionValues.filter(function (value) {
+                let option = Array.prototype.filter.call(select.options, function (option) {
+                    return isMatched(option, value);
+                })[0];
+
+                if (!option) {
+                    return true;
+                }
+
+                if (option.selected !== selected && (select.multiple || selected)) {
+                    option.selected = selected;
+                    isChanged = true;
+                }
+
+                return false;
+            });
+
+            if (isChanged) {
+                dispatchChange(select);
+            }
+
+            return missing;
+        ''', select, option_values, bool(selected), option_by, multiple)
+
+        if missing is None:
+            return False
+
+        if missing:
+            raise WebDriverException(f'Cannot using "{option_by}" to identify the option: {missing[0]}')
+
+        return True
+
+    def _page_digests(self, body_text_diff=True, regions=None):
+        # Digest of text (or HTML) of each region, or of `body` text (or the whole DOM) without regions.
+        # A region not found has null digest.
+        locators = [self._parse_locator(region) for region in regions] if regions is not None else [None]
+        return self.driver.execute_script(f'''
+            {_DIGEST_SCRIPT}
+            let resolve = function () {{
+                {_ELEMENTS_SCRIPT}
+                return elements;
+            }};
+            let bodyText = arguments[1];
+            return arguments[0].map(function (locator) {{
+                let element = locator ? resolve(locator[0], locator[1], null)[0] :
+                    bodyText ? document.body : document.documentElement;
+                if (!element) {{
+                    return null;
+                }}
+                return digest(bodyText ? element.textContent : element.outerHTML);
+            }});
+        ''', locators, body_text_diff)
+
+    def _page_mutations(self):
+        # Count DOM mutations in the page. The random id tells a newly-loaded page from the previous one.
+        return self.driver.execute_script('''
+            if (!window.__spydrMutations) {
+                let mutations = window.__spydrMutations = {id: Math.random(), count: 0};
+                new MutationObserver(function (records) {
+                    mutations.count += records.length;
+                }).observe(document, {attributes: true, characterData: true, childList: true, subtree: true});
+            }
+            return [window.__spydrMutations.id, window.__spydrMutations.count];
+        ''')
+
+    def _parse_cached_locator(self, locator):
+        if not isinstance(locator, str):
+            return self._parse_uncached_locator(locator)
+
+        return self.locator_cache.get(locator, self._parse_uncached_locator)
 
     def _parse_locator(self, locator):
+        how, what, _ = self._parse_cached_locator(locator)
+        return how, what
+
+    def _parse_uncached_locator(self, locator):
         how, what = Utils.parse_locator(locator)
 
         if how == 'yml':
             if self.yml:
-                return Utils.parse_locator(self.t(what))
+                how, what = Utils.parse_locator(self.t(what))
             else:
                 raise WebDriverException(
                     'Cannot use "yml=" as locator strategy when the instance is not assigned with .yml file.')
 
-        return how, what
+        eq = Utils.parse_eq(what) if how == HOWS['css'] else None
+
+        return how, what, eq
+
+    def _parse_snapshot_field(self, field):
+        kinds = ('attribute', 'class', 'css', 'property')
+        states = ('displayed', 'enabled', 'selected', 'rect', 'tag_name', 'text', 'text_content', 'value')
+        kind, _, name = str(field).partition('=')
+
+        if (kind in kinds and name) or (kind in states and not name):
+            return [kind, name]
 
-    def _random_option(self, options, ignored_options=[None, "", "0"]):
-        option = Utils.random_choice(options)
+        raise WebDriverException(f'Unsupported snapshot field: {field}')
 
-        if option.value in ignored_options:
-            options.remove(option)
+    def _save_screenshot(self, screenshot, filename, background):
+        if background is None:
+            background = self.screenshot_writer is not None
 
-            if len(options) > 0:
-                return self._random_option(options, ignored_options=ignored_options)
+        if not background:
+            return self._write_screenshot(screenshot, filename)
 
-            return None
+        if self.screenshot_writer is None:
+            self.screenshot_writer = True
 
-        return option
+        return self.screenshot_writer.submit(screenshot, filename, self._write_screenshot)
+
+    def _screenshot_path(self, filename, format):
+        if format not in FORMATS:
+            raise WebDriverException(f'Screenshot format must be one of {tuple(FORMATS)}: {format}')
+
+        # Stored screenshots are only named by the path, so their directories are not created.
+        suffix = None if format == 'jpeg' and filename.lower().endswith('.jpeg') else FORMATS[format]
+        return self.abspath(filename, suffix=suffix, root=self.screen_root, mkdir=self.screenshot_store is None)
+
+    def _texts(self, locator, text_content=False, root=None):
+        texts = self._execute_on_elements(locator, f'''
+            {_VISIBLE_TEXT_SCRIPT}
+            return elements.map(function (element) {{
+                return args[0] ? element.textContent : visibleText(element);
+            }});
+        ''', text_content, root=root)
+
+        return [text.strip() for text in texts or []]
+
+    def _to_clip(self, clip):
+        if not isinstance(clip, dict):
+            clip = dict(zip(('x', 'y', 'width', 'height'), clip))
+
+        return {key: clip[key] for key in ('x', 'y', 'width', 'height')}
+
+    def _track_ajax_in_new_documents(self):
+        # Scripts evaluated on new documents are registered per window (target) in DevTools.
+        handle = self.driver.current_window_handle
+
+        if handle not in self.__ajax_windows:
+            self.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': _AJAX_TRACKER_SCRIPT})
+            self.__ajax_windows.add(handle)
 
     def _try_and_catch(self, fn, exceptions=(NoSuchElementException, StaleElementReferenceException), exception_return=False):
         @wraps(fn)
@@ -3243,13 +4542,89 @@ class Spydr:
                     self.timeout = timeout_
         return wrapper
 
-    def __getattribute__(self, fn_name):
-        log_level = object.__getattribute__(self, 'log_level')
-        fn_method = object.__getattribute__(self, fn_name)
-        if logging.DEBUG >= log_level and not fn_name.startswith('_') and fn_name not in ['debug', 'info', 't'] and hasattr(fn_method, '__self__'):
-            decorator = object.__getattribute__(self, '_decorator')
-            return decorator(fn_method)
-        return fn_method
+    def _wait_until_observed(self, method, locator, script, *args, timeout=None):
+        # Without `observer_waits`, or when the async script fails, poll `method` as `wait_until()` does.
+        timeout = int(timeout) if timeout is not None else self.timeout
+
+        if not self.observer_waits:
+            return self.wait_until(method, timeout=timeout)
+
+        if locator is None:
+            how, what = None, []
+        elif isinstance(locator, WebElement):
+            how, what = None, [locator]
+        else:
+            how, what = self._parse_locator(locator)
+
+        # Check `script` now, at every DOM mutation, and every 100ms for changes without mutations (like `checked`).
+        # Resolve `{value: result}` when `script` returns a truthy result, null at `timeout`, or `{error: message}`.
+        script = f'''
+            let callback = arguments[arguments.length - 1];
+            let timeout = arguments[arguments.length - 2];
+            let params = Array.prototype.slice.call(arguments, 0, arguments.length - 2);
+            {_DISPLAYED_SCRIPT}
+            {_VISIBLE_TEXT_SCRIPT}
+            let check = function () {{
+                {_ELEMENTS_SCRIPT}
+                return (function (elements, args) {{
+                    {script}
+                }})(elements, args);
+            }};
+            let observer, interval, timer;
+            let finish = function (result) {{
+                if (observer) {{
+                    observer.disconnect();
+                    clearInterval(interval);
+                    clearTimeout(timer);
+                }}
+                callback(result);
+            }};
+            let evaluate = function () {{
+                try {{
+                    let value = check.apply(null, params);
+                    if (value) {{
+                        finish({{value: value}});
+                        return true;
+                    }}
+                }} catch (error) {{
+                    finish({{error: String(error)}});
+                    return true;
+                }}
+                return false;
+            }};
+            if (!evaluate()) {{
+                observer = new MutationObserver(evaluate);
+                observer.observe(document, {{attributes: true, characterData: true, childList: true, subtree: true}});
+                interval = setInterval(evaluate, 100);
+                timer = setTimeout(function () {{ finish(null); }}, timeout);
+            }}
+        '''
+        end_time = perf_counter() + timeout
+
+        try:
+            result = self._execute_async_until(script, timeout, how, what, None, *args)
+        except WebDriverException:
+            result = {'error': None}
+
+        if result is None:
+            raise TimeoutException(f'Condition not met in {timeout} seconds: {locator}')
+
+        if 'error' in result:
+            # `wait_until()` truncates timeouts to seconds, so round the remaining time up.
+            return self.wait_until(method, timeout=math.ceil(max(end_time - perf_counter(), 0)))
+
+        return _WebElementSpydrify._spydrify(self, result['value'])
+
+    def _write_screenshot(self, screenshot, filename):
+        if self.screenshot_store is None:
+            return write_screenshot(screenshot, filename)
+
+        try:
+            self.screenshot_store.add(screenshot, os.path.relpath(filename, os.path.abspath(self.screen_root)))
+        except IOError:
+            return False
+
+        return True
 
 
 class SpydrElement(WebElement):
@@ -3264,8 +4639,15 @@ class SpydrElement(WebElement):
         element (WebElement): WebElement instance
     """
     def __new__(cls, spydr_or_element_self, element):
+        spydr = spydr_or_element_self if isinstance(spydr_or_element_self, Spydr) else spydr_or_element_self.spydr
+
+        # Methods are decorated once in a subclass, instead of for each element.
+        if spydr.metrics is not None or spydr.tracer is not None:
+            cls = _instrumented_element_class(cls)
+
         instance = super().__new__(cls)
-        instance.__dict__.update(element.__dict__)
+        names = _decorated_method_names(cls)
+        instance.__dict__.update((k, v) for k, v in element.__dict__.items() if k not in names)
         return instance
 
     def __init__(self, spydr_or_element_self, element):
@@ -3417,8 +4799,17 @@ class SpydrElement(WebElement):
         Returns:
             WebElement: The element found
         """
-        how, what = self._parse_locator(locator)
-        return super().find_element(how, what)
+        _, _, eq = self.spydr._parse_cached_locator(locator)
+
+        if eq:
+            return self.spydr._find_eq_element(locator, eq, self)
+
+        element = self.is_located(locator)
+
+        if not isinstance(element, WebElement):
+            raise NoSuchElementException(f'Cannot locate element in the given time using: {locator}')
+
+        return element
 
     @_WebElementSpydrify()
     def find_elements(self, locator):
@@ -3431,7 +4822,16 @@ class SpydrElement(WebElement):
             list[WebElement]: All elements found
         """
         how, what = self._parse_locator(locator)
-        return super().find_elements(how, what)
+        elements = super().find_elements(how, what)
+
+        if not elements and self.spydr.implicitly_wait:
+            try:
+                elements = self._wait_until(lambda _: WebElement.find_elements(self, how, what),
+                                            timeout=self.spydr.implicitly_wait)
+            except TimeoutException:
+                pass
+
+        return elements
 
     @property
     @_WebElementSpydrify()
@@ -3571,6 +4971,7 @@ class SpydrElement(WebElement):
         """
         return super().is_enabled()
 
+    @_WebElementSpydrify()
     def is_located(self, locator, seconds=None):
         """Check if the child element is located in the given seconds.
 
@@ -3583,19 +4984,21 @@ class SpydrElement(WebElement):
         Returns:
             False/WebElement: Return False if not located. Return WebElement if located.
         """
-        implicitly_wait = self.spydr.implicitly_wait
-        seconds = seconds if seconds is not None else implicitly_wait
-
-        if seconds != implicitly_wait:
-            self.spydr.implicitly_wait = seconds
+        seconds = seconds if seconds is not None else self.spydr.implicitly_wait
+        _, _, eq = self.spydr._parse_cached_locator(locator)
 
         try:
-            return self._wait_until(lambda _: self.find_element(locator), timeout=seconds)
+            if eq:
+                return self.spydr._find_eq_element(locator, eq, self, seconds)
+
+            how, what = self._parse_locator(locator)
+
+            if not seconds:
+                return WebElement.find_element(self, how, what)
+
+            return self._wait_until(lambda _: WebElement.find_element(self, how, what), timeout=seconds)
         except (NoSuchElementException, NoSuchWindowException, StaleElementReferenceException, TimeoutException):
             return False
-        finally:
-            if seconds != implicitly_wait:
-                self.spydr.implicitly_wait = implicitly_wait
 
     def is_selected(self):
         """Whether the element is selected.
@@ -3740,18 +5143,41 @@ class SpydrElement(WebElement):
         """
         self.parent.execute_script('return arguments[0].classList.remove(arguments[1]);', self, class_name)
 
-    def save_screenshot(self, filename):
-        """Save a screenshot of the element to filename (PNG).
+    def save_screenshot(self, filename, background=None, format='png', quality=None, clip=None, scale=None):
+        """Save a screenshot of the element to filename (PNG by default).
 
         Default directory for saved screenshots is defined in: screen_root.
+        `format`, `quality`, `clip`, and `scale` are captured by DevTools `Page.captureScreenshot` (only Chromium).
 
         Args:
-            filename (str): Filename of the screenshot
+            filename (str): Filename of the screenshot. Suffixed by the format if missing.
+
+        Keyword Arguments:
+            background (bool): Capture the screenshot, then decode and write it on `Spydr.screenshot_writer`.
+                Defaults to None (background when `Spydr.screenshot_writer` is set).
+            format (str): 'png', 'jpeg', or 'webp'. Defaults to 'png'.
+            quality (int): Compression quality from 0 to 100 ('jpeg' and 'webp'). Defaults to None.
+            clip (dict/tuple): Rectangle of the element to capture, as {'x', 'y', 'width', 'height'}
+                or (x, y, width, height) relative to the element. Defaults to None (the whole element).
+            scale (float): Scale of the image, like 0.5 for half width and height. Defaults to None.
+
+        Raises:
+            WebDriverException: Raise an error when the options are not supported by the browser
 
         Returns:
-            bool: Whether the file is saved
+            bool/Future: Whether the file is saved, or Future resolved with it in background
         """
-        return self.screenshot(Utils.to_abspath(filename, suffix='.png', root=self.spydr.screen_root))
+        filename = self.spydr._screenshot_path(filename, format)
+
+        if format == 'png' and quality is None and clip is None and scale is None:
+            screenshot = self.screenshot_as_base64
+        else:
+            rect = self.rect
+            clip = self.spydr._to_clip(clip if clip is not None else (0, 0, rect['width'], rect['height']))
+            clip = dict(clip, x=rect['x'] + clip['x'], y=rect['y'] + clip['y'])
+            screenshot = self.spydr._get_screenshot(format, quality, clip, scale)
+
+        return self.spydr._save_screenshot(screenshot, filename, background)
 
     def scroll_into_view(self, behavior="auto", block="start", inline="nearest"):
         """Scroll the element's parent to be displayed.
@@ -3789,26 +5215,64 @@ class SpydrElement(WebElement):
         self.parent.execute_script('arguments[0].scrollTo(arguments[1], arguments[2]);', self, int(x), int(y))
 
     @_WebElementSpydrify()
-    def select_options(self, filter_by='value', filter_value=None):
+    def select_options(self, filter_by='value', filter_value=None, by=None):
         """Get options of an select element.  Filter the options by attribute if `filter_value` is given.
 
+        Options are filtered, the same as `has_attribute_value()`, in one script call.
+
         Keyword Arguments:
             filter_by (str): Filter options by attribute. Defaults to 'value'.
             filter_value (str): Filter option's attribute by value. Defaults to None.
+            by (str): Get options' `value`, `text`, or `index` instead of options. Defaults to None.
 
         Raises:
             InvalidSelectorException: Raise an error when element is not a select element
+            WebDriverException: Raise an error when the given `by` is unsupported
 
         Returns:
-            list[WebElement]: All filtered options
+            list[WebElement]/list[int/str]: All filtered options, or their values when `by` is given
         """
-        if self.tag_name != 'select':
-            raise InvalidSelectorException(f'Element is not a select: {self}')
+        if by is not None and by not in _OPTION_BYS:
+            raise WebDriverException(f'Unsupported select options by: {by}')
+
+        if isinstance(filter_value, bool):
+            filter_value = str(filter_value).lower()
+
+        # Attribute value falls back to property, like `get_attribute()`, and Boolean property is 'true' or null.
+        options = self.parent.execute_script(f'''
+            {_OPTIONS_SCRIPT}
+            let select = arguments[0];
+            let filterBy = arguments[1];
+            let filterValue = arguments[2];
+
+            if (select.tagName !== 'SELECT') {{
+                return null;
+            }}
 
-        options = self.find_elements('tag_name=option')
+            let attributeValue = function (option) {{
+                let property = option[filterBy];
 
-        if filter_value is not None:
-            return [opt for opt in options if opt.has_attribute_value(filter_by, filter_value)]
+                if (typeof property === 'boolean') {{
+                    return property ? 'true' : null;
+                }}
+
+                let value = option.getAttribute(filterBy);
+                return value === null && property !== undefined && property !== null ? String(property) : value;
+            }};
+
+            let options = Array.prototype.filter.call(select.options, function (option) {{
+                if (filterValue === null) {{
+                    return true;
+                }}
+                let value = attributeValue(option);
+                return value !== null && value.indexOf(filterValue) > -1;
+            }});
+
+            return arguments[3] ? optionValues(options, arguments[3]) : options;
+        ''', self, filter_by, None if filter_value is None else str(filter_value), by)
+
+        if options is None:
+            raise InvalidSelectorException(f'Element is not a select: {self}')
 
         return options
 
@@ -3876,6 +5340,59 @@ class SpydrElement(WebElement):
         """Submit a form."""
         super().submit()
 
+    def table_headers(self, text_content=False):
+        """Get the header texts of the table.
+
+        Header rows are the rows of `<thead>`, or the first row when all its cells are `<th>`.
+        When there are multiple header rows, the last row (with colspan/rowspan cells repeated) is returned.
+
+        Keyword Arguments:
+            text_content (bool): Get `textContent` instead of the visible text. Defaults to False.
+
+        Raises:
+            InvalidSelectorException: Raise an error when the element is not a table
+
+        Returns:
+            list[str]: Header texts, one per column
+        """
+        _, cells = self._table_cells(0, None, text_content=text_content, headers=True)
+        rows = list(self._expand_table_cells(cells))
+        return rows[-1] if rows else []
+
+    def table_rows(self, chunk_size=500, as_dict=False, text_content=False):
+        """Iterate the body rows of the table, reading `chunk_size` rows per script call.
+
+        Rows are yielded as soon as their chunk is read, so memory stays flat for large tables.
+
+        Keyword Arguments:
+            chunk_size (int): Number of rows to read per script call. Defaults to 500.
+            as_dict (bool): Yield rows as dict keyed by `table_headers()`. Defaults to False.
+            text_content (bool): Get `textContent` instead of the visible text. Defaults to False.
+
+        Raises:
+            InvalidSelectorException: Raise an error when the element is not a table
+
+        Returns:
+            generator: Rows as list[str] (or dict when `as_dict`), with colspan/rowspan cells repeated
+        """
+        chunk_size = max(int(chunk_size), 1)
+        headers = self.table_headers(text_content=text_content) if as_dict else None
+
+        def chunks():
+            start = None
+
+            while True:
+                start, cells = self._table_cells(start, chunk_size, text_content=text_content)
+                yield from cells
+
+                if len(cells) < chunk_size:
+                    break
+
+                start += len(cells)
+
+        for row in self._expand_table_cells(chunks()):
+            yield dict(zip(headers, row)) if as_dict else row
+
     @property
     def tag_name(self):
         """Get the element's tagName.
@@ -3907,7 +5424,7 @@ class SpydrElement(WebElement):
     def text_content(self, text_):
         self.parent.execute_script('return arguments[0].textContent = `${arguments[1]}`;', self, text_)
 
-    def texts(self, child_locator, typecast=str):
+    def texts(self, child_locator, typecast=str, bulk=False, text_content=False):
         """Text of all children elements, located by child_locator.
 
         Args:
@@ -3915,10 +5432,18 @@ class SpydrElement(WebElement):
 
         Keyword Arguments:
             typecast: Typecast the texts. Defaults to `str`.
+            bulk (bool): Locate the children elements and get all texts in one script call. Defaults to False.
+            text_content (bool): Get `textContent` instead of the visible text. Defaults to False.
 
         Returns:
             list: list of texts, by `typecast`, of the given elements
         """
+        if bulk:
+            return [typecast(text) for text in self.spydr._texts(child_locator, text_content=text_content, root=self)]
+
+        if text_content:
+            return [typecast(element.text_content.strip()) for element in self.find_elements(child_locator)]
+
         return [typecast(element.text) for element in self.find_elements(child_locator)]
 
     def toggle_attribute(self, name):
@@ -3983,7 +5508,8 @@ class SpydrElement(WebElement):
         Returns:
             bool: Whether the element is displayed
         """
-        return self._wait_until(lambda _: self.is_displayed(), timeout=timeout)
+        return self.spydr._wait_until_observed(
+            lambda _: self.is_displayed(), self, 'return isDisplayed(elements[0]);', timeout=timeout)
 
     def wait_until_not_displayed(self, timeout=None):
         """Wait until the element is not displayed.
@@ -3994,7 +5520,8 @@ class SpydrElement(WebElement):
         Returns:
             bool: Whether the element is not displayed
         """
-        return self._wait_until(lambda _: not self.is_displayed(), timeout=timeout)
+        return self.spydr._wait_until_observed(
+            lambda _: not self.is_displayed(), self, 'return !isDisplayed(elements[0]);', timeout=timeout)
 
     def wait_until_not_enabled(self, timeout=None):
         """Wait until the element is not enabled.
@@ -4005,7 +5532,8 @@ class SpydrElement(WebElement):
         Returns:
             bool: Whether the element is not enabled
         """
-        return self._wait_until(lambda _: not self.is_enabled(), timeout=timeout)
+        return self.spydr._wait_until_observed(
+            lambda _: not self.is_enabled(), self, "return elements[0].matches(':disabled');", timeout=timeout)
 
     def _actions(self):
         return ActionChains(self.parent)
@@ -4018,6 +5546,85 @@ class SpydrElement(WebElement):
 
         return how, what
 
+    def _expand_table_cells(self, rows):
+        # Repeat colspan cells across columns and carry rowspan cells to the following rows.
+        # rowspan="0" spans all the remaining rows.
+        carried = {}
+
+        for cells in rows:
+            row = []
+            cells = iter(cells)
+            cell = next(cells, None)
+
+            while cell is not None or any(column >= len(row) for column in carried):
+                column = len(row)
+
+                if column in carried:
+                    text, remaining = carried[column]
+                    row.append(text)
+                    if remaining == 1:
+                        del carried[column]
+                    elif remaining > 1:
+                        carried[column] = (text, remaining - 1)
+                    continue
+
+                if cell is None:
+                    row.append('')
+                    continue
+
+                text, colspan, rowspan = cell
+                text = text.strip()
+
+                for _ in range(max(colspan, 1)):
+                    if rowspan != 1:
+                        carried[len(row)] = (text, rowspan - 1 if rowspan > 1 else 0)
+                    row.append(text)
+
+                cell = next(cells, None)
+
+            yield row
+
+    def _table_cells(self, start, size, text_content=False, headers=False):
+        # When `start` is None, start from the first row after header rows.
+        # When `headers`, read header rows only.
+        result = self.parent.execute_script(f'''
+            {_VISIBLE_TEXT_SCRIPT}
+            let table = arguments[0];
+            let textContent = arguments[3];
+
+            if (table.tagName !== 'TABLE') {{
+                return null;
+            }}
+
+            let rows = table.rows;
+            let headerCount = 0;
+
+            if (table.tHead) {{
+                headerCount = table.tHead.rows.length;
+            }} else if (rows.length > 0 && rows[0].cells.length > 0) {{
+                headerCount = Array.prototype.every.call(rows[0].cells, function (cell) {{
+                    return cell.tagName === 'TH';
+                }}) ? 1 : 0;
+            }}
+
+            let start = arguments[1] === null ? headerCount : arguments[1];
+            let end = arguments[4] ? headerCount : Math.min(rows.length, start + arguments[2]);
+            let cells = [];
+
+            for (let i = start; i < end; i++) {{
+                cells.push(Array.prototype.map.call(rows[i].cells, function (cell) {{
+                    return [textContent ? cell.textContent : visibleText(cell), cell.colSpan, cell.rowSpan];
+                }}));
+            }}
+
+            return [start, cells];
+        ''', self, start, size, text_content, headers)
+
+        if result is None:
+            raise InvalidSelectorException(f'Element is not a table: {self}')
+
+        return result
+
     def _wait_until(self, method, timeout=None):
         timeout = int(timeout) if timeout is not None else self.spydr.timeout
         return self.spydr.wait(self.parent, timeout).until(method)